@@ -4,14 +4,9 @@ from pathlib import Path
 
 import click
 
-from profiler import format_profile_output, profile_dataframe
-from reader import read_file
-from transformer import (
-    ColumnMapping,
-    TransformConfig,
-    transform_dataframe,
-    write_output,
-)
+# The profiler, reader and transformer modules pull in pandas, which dominates
+# start-up time. They are imported inside the commands that use them, so
+# `--help` and argument errors respond without loading pandas.
 
 
 @click.group()
@@ -30,7 +25,18 @@ def cli():
 @cli.command()
 @click.argument("file_path", type=click.Path(exists=True))
 @click.option("--key", default=None, help="Key column for duplicate detection")
-def profile(file_path: str, key: str | None):
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stream CSV input in chunks of this many rows instead of loading it at once",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Reuse a cached parse of the file when it has not changed",
+)
+def profile(file_path: str, key: str | None, chunksize: int | None, cache: bool):
     """Analyze data file structure, quality, and business rule compliance.
     
     Generates a comprehensive report showing row/column counts, data types,
@@ -41,6 +47,12 @@ def profile(file_path: str, key: str | None):
         file_path: Path to CSV or Excel file to analyze.
         key: Optional column name for duplicate detection and validation.
              If specified, will validate ClientMatterCode format (XXXXX.XXXXX).
+        chunksize: Optional number of rows per chunk. When given, the file is
+                   streamed instead of loaded into memory at once. Unique and
+                   duplicate counts stay exact, so memory still grows with the
+                   number of distinct values.
+        cache: Reuse the parsed file from the local cache when unchanged.
+               Cannot be combined with chunksize.
              
     Examples:
         \\b
@@ -50,11 +62,26 @@ def profile(file_path: str, key: str | None):
         \\b
         Profile with ClientMatterCode validation:
         $ python cli.py profile data.xlsx --key ClientMatterCode
+        
+        \\b
+        Profile a large CSV one chunk at a time:
+        $ python cli.py profile big.csv --key ClientMatterCode --chunksize 500000
     """
 
+    # streamed chunks are never cached, so refuse rather than ignore --cache
+    if cache and chunksize is not None:
+        raise click.UsageError("--cache cannot be combined with --chunksize")
+
+    from profiler import format_profile_output, profile_chunks, profile_dataframe
+    from reader import read_file, read_file_chunks
+
     try:
-        df = read_file(file_path)
-        profile_data = profile_dataframe(df, key_column=key)
+        if chunksize is not None:
+            chunks = read_file_chunks(file_path, chunksize=chunksize)
+            profile_data = profile_chunks(chunks, key_column=key)
+        else:
+            df = read_file(file_path, use_cache=cache)
+            profile_data = profile_dataframe(df, key_column=key)
         output = format_profile_output(profile_data)
         click.echo(output)
     except Exception as e:
@@ -89,8 +116,19 @@ def profile(file_path: str, key: str | None):
 @click.option(
     "--output", "-o", type=click.Path(), required=True, help="Output CSV file path"
 )
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Reuse a cached parse of the file when it has not changed",
+)
 def transform(
-    source_file: str, columns: tuple, case: str, duplicates: str, key: str, output: str
+    source_file: str,
+    columns: tuple,
+    case: str,
+    duplicates: str,
+    key: str,
+    output: str,
+    cache: bool,
 ):
     """Clean and transform data files with comprehensive validation.
     
@@ -106,6 +144,7 @@ def transform(
         duplicates: How to handle duplicate key values ('keep-first', 'error').
         key: Column name for duplicate detection and ClientMatterCode validation.
         output: Path for output CSV file. Directories will be created if needed.
+        cache: Reuse the parsed file from the local cache when unchanged.
         
     Examples:
         \\b
@@ -118,6 +157,14 @@ def transform(
             --case proper --duplicates keep-first -o cleaned.csv
     """
 
+    from reader import read_file
+    from transformer import (
+        ColumnMapping,
+        TransformConfig,
+        transform_dataframe,
+        write_output,
+    )
+
     try:
         column_mappings = ColumnMapping.parse_mappings(list(columns))
         config = TransformConfig(
@@ -128,7 +175,9 @@ def transform(
             output_path=output,
         )
 
-        df = read_file(source_file)
+        # only parse the columns the mappings actually use
+        source_columns = [m.source_name for m in column_mappings]
+        df = read_file(source_file, columns=source_columns, use_cache=cache)
 
         if df.empty:
             click.echo("Warning: Input file contains no data rows", err=True)
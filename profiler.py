@@ -1,9 +1,36 @@
 # Data profiling logic
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 import click
 
 from validators import validate_dataframe_codes
 
+# only shown to the user, so there is no point materialising millions of values
+MAX_DUPLICATE_VALUES = 1000
+
+
+@dataclass(slots=True)
+class ColumnStats:
+    """Summary statistics for a single column.
+    
+    Slots keep the per-column overhead small when profiling very wide files.
+    
+    Attributes:
+        name (str): The column name.
+        dtype (object): The pandas dtype of the column.
+        unique_values (int): Number of distinct non-missing values.
+        missing_values (int): Number of missing values.
+    """
+
+    name: str
+    dtype: object
+    unique_values: int
+    missing_values: int
+
 
 def profile_dataframe(
     df: pd.DataFrame, key_column: str | None = None
@@ -22,8 +49,9 @@ def profile_dataframe(
         A dictionary containing:
         - 'total_rows': Number of data rows
         - 'total_columns': Number of columns  
-        - 'columns_stats': List of per-column statistics
-        - 'duplicate_info': Duplicate analysis (None if no key_column or no duplicates)
+        - 'columns_stats': List of ColumnStats, one per column
+        - 'duplicate_info': Duplicate analysis (None if no key_column or no duplicates).
+                            'values' lists at most MAX_DUPLICATE_VALUES keys.
         - 'validation_errors': List of validation errors (None if no key_column)
         
     Examples:
@@ -35,36 +63,52 @@ def profile_dataframe(
     total_rows = len(df)
     total_columns = len(df.columns)
 
-    # calculate per-column stats:
-    columns_stats = []
-    for column in df.columns:
-        columns_stats.append(
-            {
-                "name": column,
-                "type": df[column].dtype,
-                "unique_values": df[column].nunique(),
-                "missing_values": df[column].isnull().sum(),
-            }
+    has_key = key_column is not None and key_column in df.columns
+
+    # duplicated() is a single hash pass that never builds a counts Series;
+    # its first-occurrence mask also yields the key column's unique count
+    if has_key:
+        keys = df[key_column]
+        repeat_mask = keys.duplicated(keep="first")
+        key_unique = int((~repeat_mask & keys.notna()).sum())
+
+    unique_counts = [
+        key_unique
+        if has_key and column == key_column
+        else df[column].nunique()
+        for column in df.columns
+    ]
+    missing_counts = df.isnull().to_numpy().sum(axis=0)
+
+    # zip positionally over plain arrays instead of a label lookup per column
+    columns_stats = [
+        ColumnStats(column, dtype, int(unique), int(missing))
+        for column, dtype, unique, missing in zip(
+            df.columns, df.dtypes.to_numpy(), unique_counts, missing_counts
         )
+    ]
 
     # check for dups
     duplicate_info = None
     if key_column is not None:
-        if key_column in df.columns:
-            duplicated_mask = df[key_column].duplicated(keep=False)
-            duplicate_count = df[key_column].duplicated().sum()
+        if has_key:
+            duplicate_count = int(repeat_mask.sum())
 
-            if duplicate_count > 0:
+            if duplicate_count:
+                # keep=False marks every occurrence, so unique() lists the
+                # repeated values in order of first appearance
+                repeated = keys[keys.duplicated(keep=False)].unique()
                 duplicate_info = {
                     "count": duplicate_count,
                     "column": key_column,
-                    "values": df[duplicated_mask][key_column].unique().tolist(),
+                    "values": repeated[:MAX_DUPLICATE_VALUES].tolist(),
+                    "truncated": len(repeated) > MAX_DUPLICATE_VALUES,
                 }
         else:
             click.echo(f"Column '{key_column}' not found in DataFrame", err=True)
 
     validation_errors = None
-    if key_column is not None and key_column in df.columns:
+    if has_key:
         validation_errors = validate_dataframe_codes(df, key_column)
 
     return {
@@ -76,6 +120,95 @@ def profile_dataframe(
     }
 
 
+def profile_chunks(
+    chunks: Iterable[pd.DataFrame], key_column: str | None = None
+) -> dict[str, any]:
+    """Profile data arriving as a stream of DataFrame chunks.
+    
+    Produces the same structure as profile_dataframe() while only holding one
+    chunk in memory at a time. Counts are accumulated per chunk; unique value
+    counts stay exact, so memory grows with the number of distinct values per
+    column rather than with the number of rows.
+    
+    Args:
+        chunks: DataFrames sharing the same columns, e.g. from read_file_chunks().
+                Row indexes are expected to continue across chunks.
+        key_column: Optional column name for duplicate detection and validation.
+        
+    Returns:
+        A dictionary with the same keys as profile_dataframe().
+        
+    Examples:
+        >>> from reader import read_file_chunks
+        >>> profile = profile_chunks(read_file_chunks('large.csv'), 'ClientMatterCode')
+    """
+    total_rows = 0
+    columns = []
+    dtypes = {}
+    missing_values = {}
+    distinct_values = {}
+    key_counts = Counter()
+    validation_errors = None
+    check_key = False
+
+    for chunk_number, chunk in enumerate(chunks):
+        if chunk_number == 0:
+            columns = list(chunk.columns)
+            dtypes = {column: chunk[column].dtype for column in columns}
+            missing_values = dict.fromkeys(columns, 0)
+            distinct_values = {column: set() for column in columns}
+            if key_column is not None:
+                if key_column in chunk.columns:
+                    check_key = True
+                    validation_errors = []
+                else:
+                    click.echo(f"Column '{key_column}' not found in DataFrame", err=True)
+
+        total_rows += len(chunk)
+        for column in columns:
+            missing_values[column] += int(chunk[column].isnull().sum())
+            distinct_values[column].update(chunk[column].dropna().unique())
+
+        if check_key:
+            # value_counts(sort=False) keeps first-appearance order, missing
+            # keys included, and like duplicated() it keeps None apart from
+            # NaN. NaN != NaN, so every NaN is counted under the np.nan singleton.
+            counts = chunk[key_column].value_counts(sort=False, dropna=False)
+            for value, count in counts.items():
+                if isinstance(value, float) and value != value:
+                    value = np.nan
+                key_counts[value] += count
+            validation_errors.extend(validate_dataframe_codes(chunk, key_column))
+
+    columns_stats = [
+        ColumnStats(
+            column,
+            dtypes[column],
+            len(distinct_values[column]),
+            missing_values[column],
+        )
+        for column in columns
+    ]
+
+    duplicate_info = None
+    repeated = [value for value, count in key_counts.items() if count > 1]
+    if repeated:
+        duplicate_info = {
+            "count": sum(key_counts[value] - 1 for value in repeated),
+            "column": key_column,
+            "values": repeated[:MAX_DUPLICATE_VALUES],
+            "truncated": len(repeated) > MAX_DUPLICATE_VALUES,
+        }
+
+    return {
+        "total_rows": total_rows,
+        "total_columns": len(columns),
+        "columns_stats": columns_stats,
+        "duplicate_info": duplicate_info,
+        "validation_errors": validation_errors,
+    }
+
+
 def format_profile_output(profile: dict[str, any]) -> str:
     """Format a profile dictionary into human-readable text output.
     
@@ -95,27 +228,32 @@ def format_profile_output(profile: dict[str, any]) -> str:
         >>> 'Rows: 3' in output
         True
     """
-    output = "File Profile\n"
-    output += "============\n"
-    output += f"Rows: {profile['total_rows']}\n"
-    output += f"Columns: {profile['total_columns']}\n\n"
+    parts = [
+        "File Profile\n",
+        "============\n",
+        f"Rows: {profile['total_rows']}\n",
+        f"Columns: {profile['total_columns']}\n\n",
+        "Column Statistics:\n",
+    ]
 
-    output += "Column Statistics:\n"
     for column in profile["columns_stats"]:
-        output += f"{column['name']}: {column['type']}\n"
-        output += f"Unique Values: {column['unique_values']}\n"
-        output += f"Missing Values: {column['missing_values']}\n\n"
+        parts.append(f"{column.name}: {column.dtype}\n")
+        parts.append(f"Unique Values: {column.unique_values}\n")
+        parts.append(f"Missing Values: {column.missing_values}\n\n")
 
     if profile["duplicate_info"] is not None:
-        output += f"Duplicates found on {profile['duplicate_info']['column']}:\n"
-        output += f"  Count: {profile['duplicate_info']['count']}\n"
-        output += (
+        parts.append(f"Duplicates found on {profile['duplicate_info']['column']}:\n")
+        parts.append(f"  Count: {profile['duplicate_info']['count']}\n")
+        parts.append(
             f"  Values: {', '.join(map(str, profile['duplicate_info']['values']))}\n"
         )
+        if profile["duplicate_info"].get("truncated"):
+            parts.append(f"  (showing the first {MAX_DUPLICATE_VALUES} duplicated values)\n")
 
     if profile["validation_errors"] is not None and profile["validation_errors"]:
-        output += "\nValidation Errors:\n"
+        parts.append("\nValidation Errors:\n")
         for error in profile["validation_errors"]:
-            output += f"  Row {error['row']}: {error['value']} - {error['error']}\n"
+            parts.append(f"  Row {error['row']}: {error['value']} - {error['error']}\n")
 
-    return output
+    # join once instead of re-copying the growing string on every +=
+    return "".join(parts)
@@ -1,19 +1,176 @@
 # File reading (CSV, Excel)
+import codecs
+import hashlib
+import io
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-import chardet
 
 import pandas as pd
 
 
-def _read_csv_with_encoding_detection(file_path: str) -> pd.DataFrame:
+# Byte order marks identify an encoding outright, no decoding needed.
+# UTF-32 comes first: its little-endian BOM begins with the UTF-16 one.
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+COMMON_ENCODINGS = ['utf-8', 'cp1252', 'iso-8859-1']
+DEFAULT_CHUNKSIZE = 500_000
+MAX_READ_WORKERS = 8
+_SNIFF_SIZE = 4096
+_DECODE_BLOCK_SIZE = 1 << 20
+_SMALL_FILE_SIZE = 64 * 1024
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "csv-tool"
+CACHE_SIZE_LIMIT = 1 << 30  # evict least recently used entries beyond 1 GiB
+# bump whenever parsing changes what read_file() returns for the same bytes
+_CACHE_VERSION = 1
+# a temp entry this old was left by a writer that died before renaming it
+_STALE_TMP_AGE = 60 * 60
+
+
+def _decodes_cleanly(file_path: str, encoding: str) -> bool:
+    """Check whether a whole file decodes under the given encoding.
+    
+    Decodes incrementally in fixed-size blocks, so memory use stays constant
+    and a mismatch is usually caught within the first block.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(file_path, 'rb') as f:
+            while block := f.read(_DECODE_BLOCK_SIZE):
+                decoder.decode(block)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _pick_encoding(head: bytes, decodes: Callable[[str], bool]) -> str:
+    """Choose an encoding from the leading bytes and a whole-input decode check.
+    
+    Checks ``head`` for a byte order mark, then tries the common encodings
+    (utf-8, cp1252, iso-8859-1) in order and picks the first one for which
+    ``decodes`` reports a clean decode of the whole input. Falls back to
+    chardet on ``head``.
+    
+    Raises:
+        ValueError: If the encoding cannot be detected with sufficient confidence.
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+
+    for encoding in COMMON_ENCODINGS:
+        if decodes(encoding):
+            return encoding
+
+    # chardet is only needed for files no common encoding can decode
+    import chardet
+
+    detected = chardet.detect(head)
+    detected_encoding = detected['encoding']
+    confidence = detected['confidence']
+
+    if detected_encoding and confidence > 0.7:
+        return detected_encoding
+
+    raise ValueError(
+        f"Unable to detect file encoding with confidence. "
+        f"Detected: {detected_encoding} (confidence: {confidence:.2f}). "
+        f"Please save the file as UTF-8 and try again."
+    )
+
+
+def _detect_encoding(file_path: str) -> str:
+    """Determine the encoding of a CSV file before it is parsed.
+    
+    See _pick_encoding() for the order of checks. The whole-file decode runs
+    in constant memory, so choosing up front means the file is parsed exactly
+    once, and lets streaming readers commit to an encoding before yielding
+    any rows.
+    
+    Args:
+        file_path: Path to the CSV file to inspect.
+        
+    Returns:
+        The name of the encoding to use when parsing the file.
+        
+    Raises:
+        ValueError: If the encoding cannot be detected with sufficient confidence.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(_SNIFF_SIZE)
+
+    return _pick_encoding(head, lambda encoding: _decodes_cleanly(file_path, encoding))
+
+
+def _bytes_decode_cleanly(data: bytes, encoding: str) -> bool:
+    """Check whether an in-memory buffer decodes under the given encoding."""
+    try:
+        data.decode(encoding)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _read_csv_bytes(
+    data: bytes, usecols: Callable[[str], bool] | None = None
+) -> pd.DataFrame:
+    """Parse CSV content that is already in memory, detecting its encoding.
+    
+    Applies the same encoding detection as _read_csv_with_encoding_detection()
+    to the buffer itself, so no file has to exist on disk.
+    
+    Args:
+        data: Raw CSV bytes in any supported encoding.
+        usecols: Optional predicate selecting which columns to parse.
+        
+    Returns:
+        DataFrame with all columns as string type (dtype=str).
+        
+    Raises:
+        ValueError: If encoding cannot be detected with sufficient confidence
+                   or if the content cannot be read as a valid CSV.
+    """
+    encoding = _pick_encoding(
+        data[:_SNIFF_SIZE], lambda encoding: _bytes_decode_cleanly(data, encoding)
+    )
+
+    try:
+        return pd.read_csv(
+            io.BytesIO(data), dtype=str, encoding=encoding, engine="c", usecols=usecols
+        )
+    except UnicodeError as e:
+        raise ValueError(
+            f"Failed to read CSV file: {str(e)}. "
+            f"Please ensure the file is a valid CSV and try saving it as UTF-8."
+        ) from e
+
+
+def _read_csv_with_encoding_detection(
+    file_path: str,
+    usecols: Callable[[str], bool] | None = None,
+    file_size: int | None = None,
+) -> pd.DataFrame:
     """Read CSV file with automatic encoding detection and error handling.
     
-    Attempts to read a CSV file using common encodings first (utf-8-sig, utf-8, 
-    cp1252, iso-8859-1), then falls back to chardet for detection if needed.
+    Detects the encoding first (byte order mark, then utf-8, cp1252,
+    iso-8859-1, then chardet) and parses the file once with it.
     Provides clear error messages when encoding cannot be determined.
     
     Args:
         file_path: Path to the CSV file to read.
+        usecols: Optional predicate selecting which columns to parse.
+        file_size: Size of the file in bytes when the caller has already
+                  stat'ed it; looked up otherwise.
         
     Returns:
         DataFrame with all columns as string type (dtype=str).
@@ -22,40 +179,147 @@ def _read_csv_with_encoding_detection(file_path: str) -> pd.DataFrame:
         ValueError: If encoding cannot be detected with sufficient confidence
                    or if the file cannot be read as a valid CSV.
     """
-    # First try common encodings
-    common_encodings = ['utf-8-sig', 'utf-8', 'cp1252', 'iso-8859-1']
-    
-    for encoding in common_encodings:
-        try:
-            return pd.read_csv(file_path, dtype=str, encoding=encoding)
-        except UnicodeDecodeError:
-            continue
-    
-    # If common encodings fail, use chardet for detection
-    try:
+    if file_size is None:
+        file_size = os.path.getsize(file_path)
+
+    # Below this size, opening the file for the sniff, the decode check and
+    # the memory-mapped parse costs more than reading it into memory once
+    if file_size <= _SMALL_FILE_SIZE:
         with open(file_path, 'rb') as f:
-            raw_data = f.read(10000)  # Read first 10KB for detection
-        
-        detected = chardet.detect(raw_data)
-        detected_encoding = detected['encoding']
-        confidence = detected['confidence']
-        
-        if detected_encoding and confidence > 0.7:
-            return pd.read_csv(file_path, dtype=str, encoding=detected_encoding)
-        else:
-            raise ValueError(
-                f"Unable to detect file encoding with confidence. "
-                f"Detected: {detected_encoding} (confidence: {confidence:.2f}). "
-                f"Please save the file as UTF-8 and try again."
-            )
-    except Exception as e:
+            return _read_csv_bytes(f.read(), usecols=usecols)
+
+    encoding = _detect_encoding(file_path)
+
+    # The C engine applies dtype=str while tokenizing. The pyarrow engine infers
+    # types first and casts afterwards, which turns "12345.10000" into "12345.1"
+    # and "00123" into "123" - exactly the truncation this tool has to catch.
+    try:
+        return pd.read_csv(
+            file_path,
+            dtype=str,
+            encoding=encoding,
+            engine="c",
+            # empty files always take the in-memory branch, so this one can be mapped
+            memory_map=True,
+            usecols=usecols,
+        )
+    except UnicodeError as e:
         raise ValueError(
             f"Failed to read CSV file: {str(e)}. "
             f"Please ensure the file is a valid CSV and try saving it as UTF-8."
-        )
+        ) from e
+
+
+def _read_excel(
+    file_path: str,
+    engine: str,
+    usecols: Callable[[str], bool] | None = None,
+    file_size: int | None = None,
+) -> pd.DataFrame:
+    """Read the first sheet of an Excel workbook with all columns as strings.
+    
+    file_size is accepted for the common reader signature and not needed here.
+    """
+    return pd.read_excel(file_path, dtype=str, engine=engine, usecols=usecols)
 
 
-def read_file(file_path: str) -> pd.DataFrame:
+# extension -> reader(file_path, usecols=..., file_size=...) returning an
+# all-string DataFrame
+_READERS = {
+    ".csv": _read_csv_with_encoding_detection,
+    ".xlsx": partial(_read_excel, engine="calamine"),
+    ".xls": partial(_read_excel, engine="xlrd"),
+}
+
+
+def _cache_path(
+    file_path: str, st: os.stat_result, columns: list[str] | None
+) -> Path:
+    """Build the cache file location for a source file and column selection.
+    
+    The key covers the absolute path, modification time and size, so editing
+    or replacing the source file automatically invalidates its cache entry.
+    It also covers _CACHE_VERSION and the pandas version, so frames parsed by
+    an older release of this tool or of pandas are not served after an upgrade.
+    """
+    key = (
+        f"{_CACHE_VERSION}:{pd.__version__}:"
+        f"{os.path.abspath(file_path)}:{st.st_mtime_ns}:{st.st_size}:{columns}"
+    )
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def _evict_cache() -> None:
+    """Delete least recently used cache entries until under CACHE_SIZE_LIMIT.
+    
+    Also removes temp files abandoned by writers killed mid-write.
+    """
+    cutoff = time.time() - _STALE_TMP_AGE
+    for tmp_path in CACHE_DIR.glob("*.tmp"):
+        if tmp_path.stat().st_mtime < cutoff:
+            tmp_path.unlink(missing_ok=True)
+
+    entries = sorted(CACHE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in entries)
+    for entry in entries:
+        if total <= CACHE_SIZE_LIMIT:
+            break
+        total -= entry.stat().st_size
+        entry.unlink(missing_ok=True)
+
+
+def _read_cached(
+    file_path: str, st: os.stat_result, columns: list[str] | None
+) -> pd.DataFrame:
+    """Read a file through the on-disk cache of previously parsed DataFrames.
+    
+    A hit loads the pickled DataFrame, skipping encoding detection and
+    CSV/Excel parsing entirely. A miss parses the file and stores the result.
+    Cache write failures are ignored; the cache is only an accelerator.
+    """
+    cache_path = _cache_path(file_path, st, columns)
+
+    if cache_path.exists():
+        try:
+            df = pd.read_pickle(cache_path)
+        except Exception:
+            # a corrupt entry is dropped and the file parsed again below
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        else:
+            try:
+                os.utime(cache_path)  # mark as recently used for eviction
+            except OSError:
+                pass
+            return df
+
+    df = _parse_file(file_path, columns, st.st_size)
+
+    # entries hold client data and are unpickled later, so only the owner
+    # may read or replace them
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'wb') as f:
+                df.to_pickle(f)
+            os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        _evict_cache()
+    except OSError:
+        pass
+
+    return df
+
+
+def read_file(
+    file_path: str, columns: list[str] | None = None, use_cache: bool = False
+) -> pd.DataFrame:
     """Read data from CSV or Excel files with automatic format detection.
     
     Supports multiple file formats and handles encoding issues gracefully.
@@ -64,30 +328,159 @@ def read_file(file_path: str) -> pd.DataFrame:
     
     Args:
         file_path: Path to the data file. Supported formats: .csv, .xlsx, .xls
+        columns: Optional list of column names to load. Other columns are
+                skipped by the parser, so reading a few columns of a wide file
+                costs a fraction of a full read.
+        use_cache: If True, reuse a previously parsed copy of the file from
+                  CACHE_DIR when the file has not changed since, and store
+                  the parsed result there otherwise.
         
     Returns:
         DataFrame with all columns as string type (dtype=str).
         
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        ValueError: If the file format is not supported or cannot be read.
+        ValueError: If the file format is not supported or cannot be read,
+                   or if a requested column is not in the file.
         
     Examples:
         >>> df = read_file('data.csv')
-        >>> df = read_file('data.xlsx')
+        >>> df = read_file('data.xlsx', columns=['ClientMatterCode', 'Name'])
     """
-    path_obj = Path(file_path)
+    # a single stat both checks existence and supplies the cache key
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
-    if not path_obj.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    if use_cache:
+        return _read_cached(file_path, st, columns)
 
-    extension = path_obj.suffix.lower()
+    return _parse_file(file_path, columns, st.st_size)
 
-    if extension == ".csv":
-        return _read_csv_with_encoding_detection(file_path)
-    elif extension == ".xlsx":
-        return pd.read_excel(file_path, dtype=str, engine="openpyxl")
-    elif extension == ".xls":
-        return pd.read_excel(file_path, dtype=str, engine="xlrd")
-    else:
+
+def _parse_file(
+    file_path: str, columns: list[str] | None, file_size: int
+) -> pd.DataFrame:
+    """Parse a file with the reader registered for its extension.
+    
+    Does the work of read_file() once the file is known to exist; file_size
+    comes from read_file()'s stat so the readers need not stat it again.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+
+    # a predicate rather than a name list lets us record the full header
+    # for the error message when a requested column is missing
+    header = []
+    usecols = None
+    if columns is not None:
+        wanted = set(columns)
+
+        def usecols(column: str) -> bool:
+            header.append(column)
+            return column in wanted
+
+    reader = _READERS.get(extension)
+    if reader is None:
         raise ValueError(f"Unsupported file format: {extension}")
+
+    df = reader(file_path, usecols=usecols, file_size=file_size)
+
+    if columns is not None:
+        available = set(df.columns)
+        missing = [col for col in columns if col not in available]
+        if missing:
+            label = "Column" if len(missing) == 1 else "Columns"
+            missing_cols = ', '.join(f"'{col}'" for col in missing)
+            available_cols = ', '.join(dict.fromkeys(header))
+            raise ValueError(
+                f"{label} {missing_cols} not found in source file. "
+                f"Available columns: {available_cols}"
+            )
+
+    return df
+
+
+def read_files(
+    file_paths: list[str], columns: list[str] | None = None
+) -> list[pd.DataFrame]:
+    """Read several data files concurrently.
+    
+    The CSV and Excel parsers spend most of their time in native code that
+    releases the GIL, so a small thread pool overlaps disk reads and parsing
+    across files. A single path is read directly without starting a pool.
+    
+    Args:
+        file_paths: Paths to the data files, in any supported format.
+        columns: Optional list of column names to load from every file.
+        
+    Returns:
+        One DataFrame per path, in the same order as file_paths.
+        
+    Raises:
+        FileNotFoundError: If any of the files does not exist.
+        ValueError: If any file cannot be read (see read_file()).
+        
+    Examples:
+        >>> january, february = read_files(['jan.csv', 'feb.xlsx'])
+    """
+    if len(file_paths) <= 1:
+        return [read_file(path, columns=columns) for path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(file_paths))) as pool:
+        return list(pool.map(lambda path: read_file(path, columns=columns), file_paths))
+
+
+def read_file_chunks(
+    file_path: str, chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[pd.DataFrame]:
+    """Read a data file as a sequence of DataFrame chunks to bound memory use.
+    
+    CSV files are streamed ``chunksize`` rows at a time, so peak memory depends
+    on the chunk size rather than the file size. Excel workbooks have to be
+    unzipped in full and are yielded as a single chunk. Chunks keep a running
+    row index, so row numbers stay correct across chunk boundaries.
+    
+    Args:
+        file_path: Path to the data file. Supported formats: .csv, .xlsx, .xls
+        chunksize: Maximum number of rows per CSV chunk.
+        
+    Yields:
+        DataFrames with all columns as string type (dtype=str).
+        
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file format is not supported or cannot be read.
+        
+    Examples:
+        >>> for chunk in read_file_chunks('large.csv', chunksize=100_000):
+        ...     print(len(chunk))
+    """
+    # a single stat both checks existence and tells whether the file can be mapped
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    if os.path.splitext(file_path)[1].lower() != ".csv":
+        yield _parse_file(file_path, None, st.st_size)
+        return
+
+    encoding = _detect_encoding(file_path)
+    try:
+        # empty files cannot be mapped; they are read normally so pandas
+        # reports its usual empty-data error
+        with pd.read_csv(
+            file_path,
+            dtype=str,
+            encoding=encoding,
+            engine="c",
+            memory_map=st.st_size > 0,
+            chunksize=chunksize,
+        ) as chunks:
+            yield from chunks
+    except UnicodeError as e:
+        raise ValueError(
+            f"Failed to read CSV file: {str(e)}. "
+            f"Please ensure the file is a valid CSV and try saving it as UTF-8."
+        ) from e
@@ -0,0 +1,131 @@
+"""Shared fixtures for the test suite."""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+
+# CSV inputs used by the CLI tests, keyed by a short descriptive name
+CSV_FIXTURES = {
+    "people": "Name,Age,Status\nAlice,30,Active\nBob,25,Pending\nCharlie,35,Active",
+    "name_age": "Name,Age\nAlice,30\nBob,25",
+    "header_only": "Name,Age\n",
+    "valid_codes": "ClientMatterCode,Name,Status\n12345.67890,Alice,Active\n11111.22222,Bob,Pending",
+    "invalid_codes": "ClientMatterCode,Name\n12345.67890,Alice\ninvalid,Bob\n12345.1,Charlie",
+    "invalid_code": "ClientMatterCode,Name\n12345.67890,Alice\ninvalid,Bob",
+    "duplicate_codes": "ClientMatterCode,Name\n12345.67890,Alice\n11111.22222,Bob\n12345.67890,Charlie",
+    "duplicate_pair": "ClientMatterCode,Name\n12345.67890,Alice\n12345.67890,Bob",
+    "duplicate_keep_first": (
+        "ClientMatterCode,Name\n12345.67890,Alice\n12345.67890,Bob\n11111.22222,Charlie"
+    ),
+    "chunked_codes": (
+        "ClientMatterCode,Name\n12345.67890,Alice\n11111.22222,Bob\n"
+        "12345.67890,Charlie\n12345.1,David"
+    ),
+    "rename": "OriginalName,OriginalAge,Status\nAlice,30,ACTIVE\nBob,25,PENDING",
+    "lowercase_names": "name,status\nalice smith,ACTIVE\nbob jones,PENDING",
+    "padded": "name,age\n  Alice  ,  30  \n  Bob  ,  25  ",
+    "messy": (
+        "ClientMatterCode,Client Name,Case Status,Notes\n"
+        "12345.67890,  ALICE CORP  ,ACTIVE,Important case\n"
+        "11111.22222,bob ltd,pending,Regular case\n"
+        "12345.1,charlie inc,CLOSED,Truncated code"
+    ),
+    "clean_codes": (
+        "ClientMatterCode,Client Name,Case Status\n"
+        "12345.67890,  ALICE CORP  ,ACTIVE\n"
+        "11111.22222,bob ltd,pending\n"
+        "33333.44444,  CHARLIE INC  ,CLOSED"
+    ),
+}
+
+
+# Excel inputs used by the CLI tests, as column -> values
+EXCEL_FIXTURES = {
+    "people": {
+        "Name": ["Alice", "Bob"],
+        "Age": [30, 25],
+        "Status": ["Active", "Pending"],
+    },
+    "mixed_case": {
+        "Original Name": ["Alice Smith", "bob jones"],
+        "Original Status": ["ACTIVE", "pending"],
+    },
+}
+
+
+def pytest_configure(config):
+    """Keep pytest's temporary directories on a RAM-backed filesystem if present.
+
+    Nearly every test writes a small file and reads it back, so placing
+    tmp_path under /dev/shm (Linux tmpfs) avoids disk round-trips. pytest's
+    usual numbered directories and cleanup still apply. An explicit
+    --basetemp or PYTEST_DEBUG_TEMPROOT is left untouched, as are platforms
+    without /dev/shm.
+    """
+    if config.option.basetemp or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = "/dev/shm"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the pandas-backed modules and run a tiny parse before any test.
+
+    The CLI imports these lazily inside its commands, so without this the
+    first CLI test of each session (or xdist worker) absorbs the whole import
+    and parser start-up time and its duration is skewed.
+    """
+    from io import StringIO
+
+    import pandas as pd
+
+    import profiler  # noqa: F401
+    import reader  # noqa: F401
+    import transformer  # noqa: F401
+
+    pd.read_csv(StringIO("a,b\n1,2"), dtype=str)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide one CliRunner for the whole session.
+
+    invoke() sets up fresh output capture and a new Click context on every
+    call, so sharing the runner does not leak state between tests.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def csv_files(tmp_path_factory):
+    """Write every CSV fixture once per session and map its name to the path.
+
+    The files are shared by all tests, so they must be treated as read-only;
+    tests that produce output write it under their own tmp_path.
+    """
+    directory = tmp_path_factory.mktemp("csv")
+    paths = {}
+    for name, content in CSV_FIXTURES.items():
+        paths[name] = directory / f"{name}.csv"
+        paths[name].write_bytes(content.encode("ascii"))
+    return paths
+
+
+@pytest.fixture(scope="session")
+def excel_files(tmp_path_factory):
+    """Build every Excel fixture once per session and map its name to the path.
+
+    Writing a workbook through openpyxl is by far the slowest fixture step, so
+    it happens once here rather than in every test that needs an .xlsx input.
+    """
+    import pandas as pd
+
+    directory = tmp_path_factory.mktemp("excel")
+    paths = {}
+    for name, data in EXCEL_FIXTURES.items():
+        paths[name] = directory / f"{name}.xlsx"
+        pd.DataFrame(data).to_excel(paths[name], index=False, engine="openpyxl")
+    return paths
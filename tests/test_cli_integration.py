@@ -1,528 +1,527 @@
 """Integration tests for CLI commands."""
 
-import pandas as pd
 import pytest
-from pathlib import Path
-from click.testing import CliRunner
-import tempfile
-import os
 
 from cli import cli
 
 
-class TestCLIProfile:
-    """Integration tests for the profile command."""
-    
-    def test_profile_basic_csv(self, tmp_path):
-        """Test basic profiling of a CSV file."""
-        # Create test CSV file
-        csv_content = "Name,Age,Status\nAlice,30,Active\nBob,25,Pending\nCharlie,35,Active"
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', str(csv_file)])
-        
-        assert result.exit_code == 0
-        assert "File Profile" in result.output
-        assert "Rows: 3" in result.output
-        assert "Columns: 3" in result.output
-        assert "Name: object" in result.output
-        assert "Age: object" in result.output
-        assert "Status: object" in result.output
-    
-    def test_profile_with_key_column(self, tmp_path):
-        """Test profiling with key column specified."""
-        # Create test CSV with valid ClientMatterCode
-        csv_content = "ClientMatterCode,Name,Status\n12345.67890,Alice,Active\n11111.22222,Bob,Pending"
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', str(csv_file), '--key', 'ClientMatterCode'])
-        
-        assert result.exit_code == 0
-        assert "File Profile" in result.output
-        assert "Rows: 2" in result.output
-        # Should not have validation errors since codes are valid
-        assert "Validation Errors" not in result.output
-    
-    def test_profile_with_validation_errors(self, tmp_path):
-        """Test profiling that detects validation errors."""
-        # Create test CSV with invalid ClientMatterCode
-        csv_content = "ClientMatterCode,Name\n12345.67890,Alice\ninvalid,Bob\n12345.1,Charlie"
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', str(csv_file), '--key', 'ClientMatterCode'])
-        
-        assert result.exit_code == 0
-        assert "Validation Errors:" in result.output
-        assert "Row 3: invalid" in result.output
-        assert "Row 4: 12345.1" in result.output
-    
-    def test_profile_with_duplicates(self, tmp_path):
-        """Test profiling that detects duplicates."""
-        csv_content = "ClientMatterCode,Name\n12345.67890,Alice\n11111.22222,Bob\n12345.67890,Charlie"
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', str(csv_file), '--key', 'ClientMatterCode'])
-        
-        assert result.exit_code == 0
-        assert "Duplicates found on ClientMatterCode:" in result.output
-        assert "Count: 1" in result.output
-        assert "12345.67890" in result.output
-    
-    def test_profile_excel_file(self, tmp_path):
-        """Test profiling an Excel file."""
-        # Create test Excel file
-        df = pd.DataFrame({
-            "Name": ["Alice", "Bob"],
-            "Age": [30, 25],
-            "Status": ["Active", "Pending"]
-        })
-        xlsx_file = tmp_path / "test.xlsx"
-        df.to_excel(xlsx_file, index=False, engine="openpyxl")
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', str(xlsx_file)])
-        
-        assert result.exit_code == 0
-        assert "File Profile" in result.output
-        assert "Rows: 2" in result.output
-        assert "Columns: 3" in result.output
-    
-    def test_profile_nonexistent_file(self):
-        """Test profiling a file that doesn't exist."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', 'nonexistent.csv'])
-        
-        assert result.exit_code != 0
-        assert "does not exist" in result.output or "Error:" in result.output
-    
-    def test_profile_missing_key_column(self, tmp_path):
-        """Test profiling with key column that doesn't exist."""
-        csv_content = "Name,Age\nAlice,30\nBob,25"
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', str(csv_file), '--key', 'NonexistentColumn'])
-        
-        assert result.exit_code == 0  # Should still succeed
-        assert "Column 'NonexistentColumn' not found" in result.stderr
-        assert "File Profile" in result.output
-
-
-class TestCLITransform:
-    """Integration tests for the transform command."""
-    
-    def test_basic_transform(self, tmp_path):
-        """Test basic transformation workflow."""
-        # Create input file
-        csv_content = "OriginalName,OriginalAge,Status\nAlice,30,ACTIVE\nBob,25,PENDING"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'OriginalName:Name',
-            '-c', 'OriginalAge:Age', 
-            '--case', 'proper',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 0
-        assert "Successfully wrote 2 rows" in result.output
-        
-        # Verify output file
-        assert output_file.exists()
-        output_df = pd.read_csv(output_file, dtype=str)  # Read as strings to match output format
-        assert len(output_df) == 2
-        assert list(output_df.columns) == ["Name", "Age"]
-        assert output_df.iloc[0]["Name"] == "Alice"
-        assert output_df.iloc[0]["Age"] == "30"
-    
-    def test_transform_with_case_conversion(self, tmp_path):
-        """Test transformation with case conversion."""
-        csv_content = "name,status\nalice smith,ACTIVE\nbob jones,PENDING"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'name:Name',
-            '-c', 'status:Status',
-            '--case', 'proper',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 0
-        
-        output_df = pd.read_csv(output_file, dtype=str)
-        assert output_df.iloc[0]["Name"] == "Alice Smith"
-        assert output_df.iloc[0]["Status"] == "Active"
-        assert output_df.iloc[1]["Name"] == "Bob Jones"
-        assert output_df.iloc[1]["Status"] == "Pending"
-    
-    def test_transform_with_whitespace_trimming(self, tmp_path):
-        """Test transformation trims whitespace."""
-        csv_content = "name,age\n  Alice  ,  30  \n  Bob  ,  25  "
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'name:Name',
-            '-c', 'age:Age',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 0
-        
-        output_df = pd.read_csv(output_file, dtype=str)
-        assert output_df.iloc[0]["Name"] == "Alice"  # Trimmed
-        assert output_df.iloc[0]["Age"] == "30"      # Trimmed
-    
-    def test_transform_duplicate_handling_error(self, tmp_path):
-        """Test transformation fails on duplicates when set to error."""
-        csv_content = "ClientMatterCode,Name\n12345.67890,Alice\n12345.67890,Bob"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'ClientMatterCode',
-            '-c', 'Name',
-            '--duplicates', 'error',
-            '--key', 'ClientMatterCode',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 1
-        assert "Duplicate values found" in result.output
-        assert not output_file.exists()  # Should not create output file on error
-    
-    def test_transform_duplicate_handling_keep_first(self, tmp_path):
-        """Test transformation keeps first duplicate when set to keep-first."""
-        csv_content = "ClientMatterCode,Name\n12345.67890,Alice\n12345.67890,Bob\n11111.22222,Charlie"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'ClientMatterCode',
-            '-c', 'Name',
-            '--duplicates', 'keep-first',
-            '--key', 'ClientMatterCode',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 0
-        assert "Successfully wrote 2 rows" in result.output
-        assert "Removed 1 duplicate rows" in result.output
-        
-        output_df = pd.read_csv(output_file, dtype=str)
-        assert len(output_df) == 2
-        assert output_df.iloc[0]["Name"] == "Alice"  # First occurrence kept
-        assert output_df.iloc[1]["Name"] == "Charlie"
-    
-    def test_transform_validation_errors(self, tmp_path):
-        """Test transformation fails on validation errors."""
-        csv_content = "ClientMatterCode,Name\n12345.67890,Alice\ninvalid,Bob"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'ClientMatterCode',
-            '-c', 'Name',
-            '--key', 'ClientMatterCode',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 1
-        assert "Validation Error:" in result.output
-        assert "invalid" in result.output
-        assert not output_file.exists()
-    
-    def test_transform_missing_source_column(self, tmp_path):
-        """Test transformation fails when source column doesn't exist."""
-        csv_content = "Name,Age\nAlice,30"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'NonexistentColumn:NewName',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 1
-        assert "NonexistentColumn" in result.output
-        assert "not found" in result.output
-    
-    def test_transform_empty_file(self, tmp_path):
-        """Test transformation handles empty input file."""
-        csv_content = "Name,Age\n"  # Header only, no data
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'Name',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 1
-        assert "no data rows" in result.output
-    
-    def test_transform_excel_input(self, tmp_path):
-        """Test transformation with Excel input file."""
-        # Create Excel file
-        df = pd.DataFrame({
-            "Original Name": ["Alice Smith", "bob jones"],
-            "Original Status": ["ACTIVE", "pending"]
-        })
-        xlsx_file = tmp_path / "input.xlsx"
-        df.to_excel(xlsx_file, index=False, engine="openpyxl")
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(xlsx_file),
-            '-c', 'Original Name:Name',
-            '-c', 'Original Status:Status',
-            '--case', 'proper',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 0
-        
-        output_df = pd.read_csv(output_file, dtype=str)
-        assert output_df.iloc[0]["Name"] == "Alice Smith"
-        assert output_df.iloc[0]["Status"] == "Active"
-        assert output_df.iloc[1]["Name"] == "Bob Jones"
-        assert output_df.iloc[1]["Status"] == "Pending"
-    
-    def test_transform_creates_output_directory(self, tmp_path):
-        """Test transformation creates output directory if it doesn't exist."""
-        csv_content = "Name,Age\nAlice,30"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        # Output to nested directory that doesn't exist
-        output_file = tmp_path / "subdir" / "nested" / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'Name',
-            '-c', 'Age',
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 0
-        assert output_file.exists()
-        assert output_file.parent.exists()
-    
-    def test_transform_invalid_column_mapping_syntax(self, tmp_path):
-        """Test transformation fails with invalid column mapping syntax."""
-        csv_content = "Name,Age\nAlice,30"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', '',  # Empty mapping
-            '--output', str(output_file)
-        ])
-        
-        assert result.exit_code == 1
-        assert "cannot be empty" in result.output
-    
-    def test_transform_no_columns_specified(self, tmp_path):
-        """Test that transform command requires columns to be specified."""
-        csv_content = "Name,Age\nAlice,30"
-        input_file = tmp_path / "input.csv"
-        input_file.write_text(csv_content)
-        
-        output_file = tmp_path / "output.csv"
-        
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '--output', str(output_file)
-        ])
-        
-        # Should fail because --columns/-c is required
-        assert result.exit_code != 0
-
-
-class TestCLIErrorHandling:
-    """Tests for CLI error handling and edge cases."""
-    
-    def test_invalid_command(self):
-        """Test invalid command name."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['invalid-command'])
-        
-        assert result.exit_code != 0
-        assert "No such command" in result.output
-    
-    def test_help_command(self):
-        """Test help command works."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['--help'])
-        
-        assert result.exit_code == 0
-        assert "CSV Tool" in result.output
-        assert "profile" in result.output
-        assert "transform" in result.output
-    
-    def test_profile_help(self):
-        """Test profile command help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['profile', '--help'])
-        
-        assert result.exit_code == 0
-        assert "Profile a data file" in result.output
-        assert "--key" in result.output
-    
-    def test_transform_help(self):
-        """Test transform command help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['transform', '--help'])
-        
-        assert result.exit_code == 0
-        assert "Transform a data file" in result.output
-        assert "--columns" in result.output
-        assert "--case" in result.output
-        assert "--duplicates" in result.output
-
-
-class TestCLIEndToEnd:
-    """End-to-end integration tests combining multiple operations."""
-    
-    def test_profile_then_transform_workflow(self, tmp_path):
-        """Test realistic workflow: profile file, then transform it."""
-        # Create messy input data
-        csv_content = """ClientMatterCode,Client Name,Case Status,Notes
-12345.67890,  ALICE CORP  ,ACTIVE,Important case
-11111.22222,bob ltd,pending,Regular case
-12345.1,charlie inc,CLOSED,Truncated code"""
-        
-        input_file = tmp_path / "messy_data.csv"
-        input_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        
-        # First, profile the data to understand issues
-        profile_result = runner.invoke(cli, [
-            'profile', str(input_file),
-            '--key', 'ClientMatterCode'
-        ])
-        
-        assert profile_result.exit_code == 0
-        assert "Validation Errors:" in profile_result.output
-        assert "12345.1" in profile_result.output  # Should detect truncation
-        
-        # Now transform the data (this will fail due to validation)
-        output_file = tmp_path / "clean_data.csv"
-        transform_result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'ClientMatterCode',
-            '-c', 'Client Name:ClientName',
-            '-c', 'Case Status:Status',
-            '--case', 'proper',
-            '--key', 'ClientMatterCode',
-            '--output', str(output_file)
-        ])
-        
-        assert transform_result.exit_code == 1  # Should fail due to validation error
-        assert "Validation Error:" in transform_result.output
-    
-    def test_successful_data_cleaning_workflow(self, tmp_path):
-        """Test successful end-to-end data cleaning workflow."""
-        # Create data with only formatting issues (no validation errors)
-        csv_content = """ClientMatterCode,Client Name,Case Status
-12345.67890,  ALICE CORP  ,ACTIVE
-11111.22222,bob ltd,pending
-33333.44444,  CHARLIE INC  ,CLOSED"""
-        
-        input_file = tmp_path / "data.csv"
-        input_file.write_text(csv_content)
-        
-        runner = CliRunner()
-        
-        # Profile the data
-        profile_result = runner.invoke(cli, [
-            'profile', str(input_file),
-            '--key', 'ClientMatterCode'
-        ])
-        
-        assert profile_result.exit_code == 0
-        assert "Rows: 3" in profile_result.output
-        assert "Validation Errors:" not in profile_result.output  # Should be clean
-        
-        # Transform the data
-        output_file = tmp_path / "cleaned_data.csv"
-        transform_result = runner.invoke(cli, [
-            'transform', str(input_file),
-            '-c', 'ClientMatterCode',
-            '-c', 'Client Name:ClientName',
-            '-c', 'Case Status:Status',
-            '--case', 'proper',
-            '--key', 'ClientMatterCode',
-            '--output', str(output_file)
-        ])
-        
-        assert transform_result.exit_code == 0
-        assert "Successfully wrote 3 rows" in transform_result.output
-        
-        # Verify the cleaned data
-        output_df = pd.read_csv(output_file, dtype=str)
-        assert len(output_df) == 3
-        assert list(output_df.columns) == ["ClientMatterCode", "ClientName", "Status"]
-        
-        # Check data cleaning worked
-        assert output_df.iloc[0]["ClientName"] == "Alice Corp"  # Trimmed and proper case
-        assert output_df.iloc[1]["ClientName"] == "Bob Ltd"     # Proper case
-        assert output_df.iloc[0]["Status"] == "Active"         # Proper case
-        assert output_df.iloc[1]["Status"] == "Pending"        # Proper case
-        
-        # Codes should be preserved exactly
-        assert output_df.iloc[0]["ClientMatterCode"] == "12345.67890"
-        assert output_df.iloc[1]["ClientMatterCode"] == "11111.22222"
-        assert output_df.iloc[2]["ClientMatterCode"] == "33333.44444"
\ No newline at end of file
+def run_cli(args):
+    """Run the CLI in-process on a failure path and return its exit code.
+    
+    Skips CliRunner's stream swapping; the caller reads the error output from
+    pytest's capfd capture instead.
+    """
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(args, standalone_mode=False)
+    return excinfo.value.code
+
+
+def write_csv(path, rows):
+    """Write rows of ASCII string fields as a CSV file with one bytes write."""
+    path.write_bytes(("\n".join(",".join(row) for row in rows) + "\n").encode("ascii"))
+
+
+def expected_duplicates(keys):
+    """Return every repeat occurrence of a key, in order, in a single pass.
+    
+    Mirrors --duplicates keep-first: the first occurrence of each key is kept
+    and each later one is reported, so fixtures can grow without the expected
+    values needing a quadratic scan.
+    """
+    seen = set()
+    repeats = []
+    for key in keys:
+        if key in seen:
+            repeats.append(key)
+        else:
+            seen.add(key)
+    return repeats
+
+
+# Integration tests for the profile command.
+@pytest.mark.parametrize(
+    "input_name, args, expected, unexpected",
+    [
+        pytest.param(
+            "people",
+            [],
+            ["File Profile", "Rows: 3", "Columns: 3",
+             "Name: object", "Age: object", "Status: object"],
+            [],
+            id="basic_csv",
+        ),
+        pytest.param(
+            "valid_codes",
+            ["--key", "ClientMatterCode"],
+            ["File Profile", "Rows: 2"],
+            ["Validation Errors"],  # codes are valid
+            id="key_column",
+        ),
+        pytest.param(
+            "invalid_codes",
+            ["--key", "ClientMatterCode"],
+            ["Validation Errors:", "Row 3: invalid", "Row 4: 12345.1"],
+            [],
+            id="validation_errors",
+        ),
+        pytest.param(
+            "duplicate_codes",
+            ["--key", "ClientMatterCode"],
+            ["Duplicates found on ClientMatterCode:", "Count: 1", "12345.67890"],
+            [],
+            id="duplicates",
+        ),
+        pytest.param(
+            "chunked_codes",
+            ["--key", "ClientMatterCode", "--chunksize", "2"],
+            ["Rows: 4", "Duplicates found on ClientMatterCode:", "Row 5: 12345.1"],
+            [],
+            id="chunksize",
+        ),
+    ],
+)
+def test_profile_cases(runner, csv_files, input_name, args, expected, unexpected):
+    """Test profiling CSV files with and without a key column."""
+    result = runner.invoke(
+        cli, ['profile', str(csv_files[input_name]), *args], catch_exceptions=False
+    )
+    
+    output = result.output
+    assert result.exit_code == 0
+    for text in expected:
+        assert text in output
+    for text in unexpected:
+        assert text not in output
+
+
+def test_profile_excel_file(runner, excel_files):
+    """Test profiling an Excel file."""
+    xlsx_file = excel_files["people"]
+    
+    result = runner.invoke(cli, ['profile', str(xlsx_file)], catch_exceptions=False)
+    
+    output = result.output
+    assert result.exit_code == 0
+    assert "File Profile" in output
+    assert "Rows: 2" in output
+    assert "Columns: 3" in output
+
+
+def test_profile_nonexistent_file(runner):
+    """Test profiling a file that doesn't exist."""
+    result = runner.invoke(cli, ['profile', 'nonexistent.csv'])
+    
+    output = result.output
+    assert result.exit_code != 0
+    assert "does not exist" in output or "Error:" in output
+
+
+def test_profile_missing_key_column(runner, csv_files):
+    """Test profiling with key column that doesn't exist."""
+    csv_file = csv_files["name_age"]
+    
+    result = runner.invoke(
+        cli, ['profile', str(csv_file), '--key', 'NonexistentColumn'], catch_exceptions=False
+    )
+    
+    assert result.exit_code == 0  # Should still succeed
+    assert "Column 'NonexistentColumn' not found" in result.stderr
+    assert "File Profile" in result.output
+
+
+def test_profile_rejects_cache_with_chunksize(runner, csv_files):
+    """Test that --cache is refused rather than ignored when streaming."""
+    result = runner.invoke(
+        cli, ['profile', str(csv_files["people"]), '--chunksize', '2', '--cache']
+    )
+    
+    assert result.exit_code == 2
+    assert "--cache cannot be combined with --chunksize" in result.output
+
+
+# Integration tests for the transform command.
+@pytest.mark.parametrize(
+    "input_name, args, expected",
+    [
+        pytest.param(
+            "rename",
+            ["-c", "OriginalName:Name", "-c", "OriginalAge:Age", "--case", "proper"],
+            "Name,Age\nAlice,30\nBob,25\n",
+            id="rename",
+        ),
+        pytest.param(
+            "lowercase_names",
+            ["-c", "name:Name", "-c", "status:Status", "--case", "proper"],
+            "Name,Status\nAlice Smith,Active\nBob Jones,Pending\n",
+            id="case_conversion",
+        ),
+        pytest.param(
+            "padded",
+            ["-c", "name:Name", "-c", "age:Age"],
+            "Name,Age\nAlice,30\nBob,25\n",  # trimmed
+            id="whitespace_trimming",
+        ),
+    ],
+)
+def test_transform_cases(runner, csv_files, tmp_path, input_name, args, expected):
+    """Test column mapping, case conversion and whitespace trimming."""
+    output_file = tmp_path / "output.csv"
+    
+    result = runner.invoke(cli, [
+        'transform', str(csv_files[input_name]), *args, '--output', str(output_file)
+    ], catch_exceptions=False)
+    
+    assert result.exit_code == 0
+    assert "Successfully wrote 2 rows" in result.output
+    assert output_file.read_text() == expected
+
+
+def test_transform_duplicate_handling_error(capfd, csv_files, tmp_path):
+    """Test transformation fails on duplicates when set to error."""
+    input_file = csv_files["duplicate_pair"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    exit_code = run_cli([
+        'transform', str(input_file),
+        '-c', 'ClientMatterCode',
+        '-c', 'Name',
+        '--duplicates', 'error',
+        '--key', 'ClientMatterCode',
+        '--output', str(output_file)
+    ])
+    
+    assert exit_code == 1
+    err = capfd.readouterr().err
+    assert "Duplicate values found" in err
+    assert not output_file.exists()  # Should not create output file on error
+
+
+def test_transform_duplicate_handling_keep_first(runner, csv_files, tmp_path):
+    """Test transformation keeps first duplicate when set to keep-first."""
+    input_file = csv_files["duplicate_keep_first"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    result = runner.invoke(cli, [
+        'transform', str(input_file),
+        '-c', 'ClientMatterCode',
+        '-c', 'Name',
+        '--duplicates', 'keep-first',
+        '--key', 'ClientMatterCode',
+        '--output', str(output_file)
+    ], catch_exceptions=False)
+    
+    output = result.output
+    assert result.exit_code == 0
+    assert "Successfully wrote 2 rows" in output
+    assert "Removed 1 duplicate rows" in output
+    
+    # first occurrence kept
+    assert output_file.read_text() == (
+        "ClientMatterCode,Name\n12345.67890,Alice\n11111.22222,Charlie\n"
+    )
+
+
+@pytest.mark.parametrize("row_count", [10, 100, 1000])
+def test_transform_keep_first_scales(runner, tmp_path, row_count):
+    """Test keep-first duplicate removal on generated inputs of growing size."""
+    keys = [f"{(i * 7919) % (row_count * 3 // 4):05d}.00000" for i in range(row_count)]
+    input_file = tmp_path / "input.csv"
+    write_csv(input_file, [["ClientMatterCode"], *([key] for key in keys)])
+    output_file = tmp_path / "output.csv"
+    
+    result = runner.invoke(cli, [
+        'transform', str(input_file),
+        '-c', 'ClientMatterCode',
+        '--duplicates', 'keep-first',
+        '--output', str(output_file)
+    ], catch_exceptions=False)
+    
+    removed = len(expected_duplicates(keys))
+    kept = list(dict.fromkeys(keys))
+    assert result.exit_code == 0
+    assert f"Removed {removed} duplicate rows" in result.output
+    assert output_file.read_text() == "ClientMatterCode\n" + "\n".join(kept) + "\n"
+
+
+def test_transform_validation_errors(capfd, csv_files, tmp_path):
+    """Test transformation fails on validation errors."""
+    input_file = csv_files["invalid_code"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    exit_code = run_cli([
+        'transform', str(input_file),
+        '-c', 'ClientMatterCode',
+        '-c', 'Name',
+        '--key', 'ClientMatterCode',
+        '--output', str(output_file)
+    ])
+    
+    assert exit_code == 1
+    err = capfd.readouterr().err
+    assert "Validation Error:" in err
+    assert "invalid" in err
+    assert not output_file.exists()
+
+
+def test_transform_missing_source_column(capfd, csv_files, tmp_path):
+    """Test transformation fails when source column doesn't exist."""
+    input_file = csv_files["name_age"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    exit_code = run_cli([
+        'transform', str(input_file),
+        '-c', 'NonexistentColumn:NewName',
+        '--output', str(output_file)
+    ])
+    
+    assert exit_code == 1
+    err = capfd.readouterr().err
+    assert "NonexistentColumn" in err
+    assert "not found" in err
+
+
+def test_transform_reports_all_missing_source_columns(capfd, csv_files, tmp_path):
+    """Test that every missing source column is named in one error."""
+    input_file = csv_files["name_age"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    exit_code = run_cli([
+        'transform', str(input_file),
+        '-c', 'MissingOne',
+        '-c', 'Name',
+        '-c', 'MissingTwo',
+        '--output', str(output_file)
+    ])
+    
+    assert exit_code == 1
+    err = capfd.readouterr().err
+    assert "Columns 'MissingOne', 'MissingTwo' not found in source file" in err
+    assert "Available columns: Name, Age" in err
+    assert not output_file.exists()
+
+
+def test_transform_empty_file(capfd, csv_files, tmp_path):
+    """Test transformation handles empty input file."""
+    input_file = csv_files["header_only"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    exit_code = run_cli([
+        'transform', str(input_file),
+        '-c', 'Name',
+        '--output', str(output_file)
+    ])
+    
+    assert exit_code == 1
+    err = capfd.readouterr().err
+    assert "no data rows" in err
+
+
+def test_transform_excel_input(runner, excel_files, tmp_path):
+    """Test transformation with Excel input file."""
+    xlsx_file = excel_files["mixed_case"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    result = runner.invoke(cli, [
+        'transform', str(xlsx_file),
+        '-c', 'Original Name:Name',
+        '-c', 'Original Status:Status',
+        '--case', 'proper',
+        '--output', str(output_file)
+    ], catch_exceptions=False)
+    
+    assert result.exit_code == 0
+    
+    assert output_file.read_text() == "Name,Status\nAlice Smith,Active\nBob Jones,Pending\n"
+
+
+def test_transform_creates_output_directory(runner, csv_files, tmp_path):
+    """Test transformation creates output directory if it doesn't exist."""
+    input_file = csv_files["name_age"]
+    
+    # Output to nested directory that doesn't exist
+    output_file = tmp_path / "subdir" / "nested" / "output.csv"
+    
+    result = runner.invoke(cli, [
+        'transform', str(input_file),
+        '-c', 'Name',
+        '-c', 'Age',
+        '--output', str(output_file)
+    ], catch_exceptions=False)
+    
+    assert result.exit_code == 0
+    assert output_file.exists()
+    assert output_file.parent.exists()
+
+
+def test_transform_invalid_column_mapping_syntax(capfd, csv_files, tmp_path):
+    """Test transformation fails with invalid column mapping syntax."""
+    input_file = csv_files["name_age"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    exit_code = run_cli([
+        'transform', str(input_file),
+        '-c', '',  # Empty mapping
+        '--output', str(output_file)
+    ])
+    
+    assert exit_code == 1
+    err = capfd.readouterr().err
+    assert "cannot be empty" in err
+
+
+def test_transform_no_columns_specified(runner, csv_files, tmp_path):
+    """Test that transform command requires columns to be specified."""
+    input_file = csv_files["name_age"]
+    
+    output_file = tmp_path / "output.csv"
+    
+    result = runner.invoke(cli, [
+        'transform', str(input_file),
+        '--output', str(output_file)
+    ])
+    
+    # Should fail because --columns/-c is required
+    assert result.exit_code != 0
+
+
+# Tests for CLI error handling and edge cases.
+def test_invalid_command(runner):
+    """Test invalid command name."""
+    result = runner.invoke(cli, ['invalid-command'])
+    
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+
+def test_help_command(runner):
+    """Test help command works."""
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False)
+    
+    output = result.output
+    assert result.exit_code == 0
+    assert "CSV Tool" in output
+    assert "profile" in output
+    assert "transform" in output
+
+
+def test_profile_help(runner):
+    """Test profile command help."""
+    result = runner.invoke(cli, ['profile', '--help'], catch_exceptions=False)
+    
+    output = result.output
+    assert result.exit_code == 0
+    assert "Profile a data file" in output
+    assert "--key" in output
+
+
+def test_transform_help(runner):
+    """Test transform command help."""
+    result = runner.invoke(cli, ['transform', '--help'], catch_exceptions=False)
+    
+    output = result.output
+    assert result.exit_code == 0
+    assert "Transform a data file" in output
+    assert "--columns" in output
+    assert "--case" in output
+    assert "--duplicates" in output
+
+
+# End-to-end integration tests combining multiple operations.
+def test_profile_then_transform_workflow(csv_files):
+    """Test realistic workflow: profile file, then transform it."""
+    from profiler import profile_dataframe
+    from reader import read_file
+    from transformer import ColumnMapping, TransformConfig, transform_dataframe
+    
+    df = read_file(str(csv_files["messy"]))
+    
+    # First, profile the data to understand issues
+    profile = profile_dataframe(df, key_column="ClientMatterCode")
+    
+    assert [error["value"] for error in profile["validation_errors"]] == ["12345.1"]
+    
+    # Now transform the data (this will fail due to validation)
+    config = TransformConfig(
+        column_mappings=ColumnMapping.parse_mappings(
+            ["ClientMatterCode", "Client Name:ClientName", "Case Status:Status"]
+        ),
+        case_transform="proper",
+        duplicate_handling="error",
+        key_column="ClientMatterCode",
+        output_path="unused.csv",
+    )
+    with pytest.raises(ValueError, match="12345.1"):
+        transform_dataframe(df, config)
+
+
+def test_successful_data_cleaning_workflow(csv_files, tmp_path):
+    """Test successful end-to-end data cleaning workflow."""
+    from profiler import profile_dataframe
+    from reader import read_file
+    from transformer import (
+        ColumnMapping,
+        TransformConfig,
+        transform_dataframe,
+        write_output,
+    )
+    
+    df = read_file(str(csv_files["clean_codes"]))
+    
+    # Profile the data
+    profile = profile_dataframe(df, key_column="ClientMatterCode")
+    
+    assert profile["total_rows"] == 3
+    assert profile["validation_errors"] == []  # Should be clean
+    
+    # Transform the data
+    output_file = tmp_path / "cleaned_data.csv"
+    config = TransformConfig(
+        column_mappings=ColumnMapping.parse_mappings(
+            ["ClientMatterCode", "Client Name:ClientName", "Case Status:Status"]
+        ),
+        case_transform="proper",
+        duplicate_handling="error",
+        key_column="ClientMatterCode",
+        output_path=str(output_file),
+    )
+    write_output(transform_dataframe(df, config), output_file)
+    
+    # Names trimmed and proper-cased, codes preserved exactly
+    assert output_file.read_text() == (
+        "ClientMatterCode,ClientName,Status\n"
+        "12345.67890,Alice Corp,Active\n"
+        "11111.22222,Bob Ltd,Pending\n"
+        "33333.44444,Charlie Inc,Closed\n"
+    )
+
+
+def test_cli_smoke(runner, csv_files, tmp_path):
+    """Test that profile and transform are wired through the CLI."""
+    input_file = csv_files["clean_codes"]
+    output_file = tmp_path / "cleaned_data.csv"
+    
+    profile_result = runner.invoke(cli, [
+        'profile', str(input_file),
+        '--key', 'ClientMatterCode'
+    ], catch_exceptions=False)
+    transform_result = runner.invoke(cli, [
+        'transform', str(input_file),
+        '-c', 'ClientMatterCode',
+        '-c', 'Client Name:ClientName',
+        '--case', 'proper',
+        '--key', 'ClientMatterCode',
+        '--output', str(output_file)
+    ], catch_exceptions=False)
+    
+    assert profile_result.exit_code == 0
+    assert "Rows: 3" in profile_result.output
+    assert transform_result.exit_code == 0
+    assert "Successfully wrote 3 rows" in transform_result.output
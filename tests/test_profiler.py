@@ -1,11 +1,17 @@
 """Tests for the profiler module."""
 
+import numpy as np
 import pandas as pd
 import pytest
 from io import StringIO
 import sys
 
-from profiler import profile_dataframe, format_profile_output
+from profiler import ColumnStats, profile_chunks, profile_dataframe, format_profile_output
+
+
+def by_name(columns_stats):
+    """Index a profile's column stats by column name."""
+    return {stats.name: stats for stats in columns_stats}
 
 
 class TestProfileDataframe:
@@ -30,18 +36,19 @@ class TestProfileDataframe:
         assert len(profile["columns_stats"]) == 3
         
         # Find each column's stats
-        name_stats = next(col for col in profile["columns_stats"] if col["name"] == "Name")
-        age_stats = next(col for col in profile["columns_stats"] if col["name"] == "Age")
-        status_stats = next(col for col in profile["columns_stats"] if col["name"] == "Status")
+        stats = by_name(profile["columns_stats"])
+        name_stats = stats["Name"]
+        age_stats = stats["Age"]
+        status_stats = stats["Status"]
         
-        assert name_stats["unique_values"] == 3
-        assert name_stats["missing_values"] == 0
+        assert name_stats.unique_values == 3
+        assert name_stats.missing_values == 0
         
-        assert age_stats["unique_values"] == 3
-        assert age_stats["missing_values"] == 0
+        assert age_stats.unique_values == 3
+        assert age_stats.missing_values == 0
         
-        assert status_stats["unique_values"] == 2  # "Active" appears twice
-        assert status_stats["missing_values"] == 0
+        assert status_stats.unique_values == 2  # "Active" appears twice
+        assert status_stats.missing_values == 0
     
     def test_empty_dataframe(self):
         """Test profiling an empty DataFrame."""
@@ -69,13 +76,14 @@ class TestProfileDataframe:
         assert profile["total_columns"] == 3
         
         # Check missing values counting
-        name_stats = next(col for col in profile["columns_stats"] if col["name"] == "Name")
-        age_stats = next(col for col in profile["columns_stats"] if col["name"] == "Age")
-        status_stats = next(col for col in profile["columns_stats"] if col["name"] == "Status")
-        
-        assert name_stats["missing_values"] == 1  # Only None counts as missing, not ""
-        assert age_stats["missing_values"] == 1
-        assert status_stats["missing_values"] == 1
+        stats = by_name(profile["columns_stats"])
+        name_stats = stats["Name"]
+        age_stats = stats["Age"]
+        status_stats = stats["Status"]
+        
+        assert name_stats.missing_values == 1  # Only None counts as missing, not ""
+        assert age_stats.missing_values == 1
+        assert status_stats.missing_values == 1
     
     def test_dataframe_with_duplicates(self):
         """Test duplicate detection functionality."""
@@ -96,6 +104,22 @@ class TestProfileDataframe:
         assert "12345.67890" in dup_info["values"]
         assert len(dup_info["values"]) == 1  # Only one unique duplicated value
     
+    def test_duplicate_values_are_capped(self):
+        """Test that the reported duplicate values list is capped."""
+        from profiler import MAX_DUPLICATE_VALUES
+        
+        codes = [f"{i:05d}.00000" for i in range(MAX_DUPLICATE_VALUES + 5)]
+        df = pd.DataFrame({"ClientMatterCode": codes + codes})
+        
+        profile = profile_dataframe(df, key_column="ClientMatterCode")
+        
+        dup_info = profile["duplicate_info"]
+        assert dup_info["count"] == len(codes)  # count is still exact
+        assert len(dup_info["values"]) == MAX_DUPLICATE_VALUES
+        assert dup_info["values"][0] == "00000.00000"
+        assert dup_info["truncated"] is True
+        assert "showing the first" in format_profile_output(profile)
+    
     def test_no_duplicates(self):
         """Test when no duplicates are found."""
         df = pd.DataFrame({
@@ -154,7 +178,7 @@ class TestProfileDataframe:
             "Integer": [30, 25],
             "Float": [30.5, 25.7],
             "Boolean": [True, False],
-            "Date": pd.to_datetime(["2023-01-01", "2023-01-02"])
+            "Date": np.array(["2023-01-01", "2023-01-02"], dtype="datetime64[ns]")
         })
         
         profile = profile_dataframe(df)
@@ -163,13 +187,99 @@ class TestProfileDataframe:
         assert profile["total_columns"] == 5
         
         # Check that all columns are accounted for
-        column_names = [col["name"] for col in profile["columns_stats"]]
+        column_names = [col.name for col in profile["columns_stats"]]
         assert set(column_names) == {"String", "Integer", "Float", "Boolean", "Date"}
         
         # Check that data types are captured
         for col_stat in profile["columns_stats"]:
-            assert "type" in col_stat
-            assert col_stat["type"] is not None
+            assert col_stat.dtype is not None
+    
+    def test_key_column_unique_count_ignores_missing(self):
+        """Test that the key column's unique count matches nunique with mixed nulls."""
+        df = pd.DataFrame({
+            "ClientMatterCode": ["12345.67890", None, float("nan"), "12345.67890", pd.NA],
+        }, dtype=object)
+        
+        profile = profile_dataframe(df, key_column="ClientMatterCode")
+        
+        key_stats = profile["columns_stats"][0]
+        assert key_stats.unique_values == df["ClientMatterCode"].nunique() == 1
+        assert key_stats.missing_values == 3
+
+
+class TestProfileChunks:
+    """Tests for the streaming profile_chunks function."""
+    
+    def _split(self, df, size):
+        """Split a DataFrame into row chunks that keep the running index."""
+        return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+    
+    def test_matches_profile_dataframe(self):
+        """Test that chunked profiling agrees with whole-frame profiling."""
+        df = pd.DataFrame({
+            "ClientMatterCode": [
+                "12345.67890", "11111.1", "12345.67890", None, "22222.33333", "11111.1"
+            ],
+            "Name": ["Alice", "Bob", None, "David", "Alice", "Frank"]
+        })
+        
+        expected = profile_dataframe(df, key_column="ClientMatterCode")
+        profile = profile_chunks(self._split(df, 4), key_column="ClientMatterCode")
+        
+        assert profile["total_rows"] == expected["total_rows"]
+        assert profile["total_columns"] == expected["total_columns"]
+        for stats, expected_stats in zip(profile["columns_stats"], expected["columns_stats"]):
+            assert stats.name == expected_stats.name
+            assert stats.unique_values == expected_stats.unique_values
+            assert stats.missing_values == expected_stats.missing_values
+        assert profile["duplicate_info"]["count"] == expected["duplicate_info"]["count"]
+        assert profile["duplicate_info"]["values"] == expected["duplicate_info"]["values"]
+        assert profile["validation_errors"] == expected["validation_errors"]
+    
+    def test_duplicates_across_chunks(self):
+        """Test that duplicates split across chunk boundaries are found."""
+        df = pd.DataFrame({"ClientMatterCode": ["12345.67890", "11111.22222", "12345.67890"]})
+        
+        profile = profile_chunks(self._split(df, 1), key_column="ClientMatterCode")
+        
+        assert profile["duplicate_info"]["count"] == 1
+        assert profile["duplicate_info"]["values"] == ["12345.67890"]
+        assert profile["validation_errors"] == []
+    
+    def test_duplicate_info_matches_with_missing_keys(self):
+        """Test that repeated missing keys keep first-appearance order and None/NaN apart."""
+        df = pd.DataFrame({
+            "ClientMatterCode": [
+                "12345.67890", np.nan, "11111.22222", None,
+                "11111.22222", np.nan, "12345.67890", None
+            ]
+        })
+        
+        expected = profile_dataframe(df, key_column="ClientMatterCode")
+        profile = profile_chunks(self._split(df, 3), key_column="ClientMatterCode")
+        
+        assert profile["duplicate_info"] == expected["duplicate_info"]
+        assert profile["duplicate_info"]["count"] == 4
+    
+    def test_missing_key_column(self, capsys):
+        """Test behavior when key column doesn't exist."""
+        df = pd.DataFrame({"Name": ["Alice", "Bob"]})
+        
+        profile = profile_chunks(self._split(df, 1), key_column="NonexistentColumn")
+        
+        captured = capsys.readouterr()
+        assert captured.err.count("Column 'NonexistentColumn' not found") == 1
+        assert profile["total_rows"] == 2
+        assert profile["duplicate_info"] is None
+        assert profile["validation_errors"] is None
+    
+    def test_no_chunks(self):
+        """Test profiling an empty stream."""
+        profile = profile_chunks([])
+        
+        assert profile["total_rows"] == 0
+        assert profile["total_columns"] == 0
+        assert profile["columns_stats"] == []
 
 
 class TestFormatProfileOutput:
@@ -181,8 +291,8 @@ class TestFormatProfileOutput:
             "total_rows": 3,
             "total_columns": 2,
             "columns_stats": [
-                {"name": "Name", "type": "object", "unique_values": 3, "missing_values": 0},
-                {"name": "Age", "type": "int64", "unique_values": 3, "missing_values": 0}
+                ColumnStats("Name", "object", 3, 0),
+                ColumnStats("Age", "int64", 3, 0)
             ],
             "duplicate_info": None,
             "validation_errors": None
@@ -205,8 +315,8 @@ class TestFormatProfileOutput:
             "total_rows": 4,
             "total_columns": 2,
             "columns_stats": [
-                {"name": "Code", "type": "object", "unique_values": 3, "missing_values": 0},
-                {"name": "Name", "type": "object", "unique_values": 4, "missing_values": 0}
+                ColumnStats("Code", "object", 3, 0),
+                ColumnStats("Name", "object", 4, 0)
             ],
             "duplicate_info": {
                 "count": 1,
@@ -228,7 +338,7 @@ class TestFormatProfileOutput:
             "total_rows": 3,
             "total_columns": 2,
             "columns_stats": [
-                {"name": "Code", "type": "object", "unique_values": 3, "missing_values": 0}
+                ColumnStats("Code", "object", 3, 0)
             ],
             "duplicate_info": None,
             "validation_errors": [
@@ -249,7 +359,7 @@ class TestFormatProfileOutput:
             "total_rows": 2,
             "total_columns": 1,
             "columns_stats": [
-                {"name": "Code", "type": "object", "unique_values": 2, "missing_values": 0}
+                ColumnStats("Code", "object", 2, 0)
             ],
             "duplicate_info": None,
             "validation_errors": []  # Empty list
@@ -266,9 +376,9 @@ class TestFormatProfileOutput:
             "total_rows": 5,
             "total_columns": 3,
             "columns_stats": [
-                {"name": "Code", "type": "object", "unique_values": 4, "missing_values": 1},
-                {"name": "Name", "type": "object", "unique_values": 5, "missing_values": 0},
-                {"name": "Status", "type": "object", "unique_values": 2, "missing_values": 0}
+                ColumnStats("Code", "object", 4, 1),
+                ColumnStats("Name", "object", 5, 0),
+                ColumnStats("Status", "object", 2, 0)
             ],
             "duplicate_info": {
                 "count": 1,
@@ -300,7 +410,7 @@ class TestFormatProfileOutput:
             "total_rows": 6,
             "total_columns": 1,
             "columns_stats": [
-                {"name": "Code", "type": "object", "unique_values": 4, "missing_values": 0}
+                ColumnStats("Code", "object", 4, 0)
             ],
             "duplicate_info": {
                 "count": 2,
@@ -322,10 +432,10 @@ class TestFormatProfileOutput:
             "total_rows": 2,
             "total_columns": 4,
             "columns_stats": [
-                {"name": "String", "type": "object", "unique_values": 2, "missing_values": 0},
-                {"name": "Integer", "type": "int64", "unique_values": 2, "missing_values": 0},
-                {"name": "Float", "type": "float64", "unique_values": 2, "missing_values": 0},
-                {"name": "Boolean", "type": "bool", "unique_values": 2, "missing_values": 0}
+                ColumnStats("String", "object", 2, 0),
+                ColumnStats("Integer", "int64", 2, 0),
+                ColumnStats("Float", "float64", 2, 0),
+                ColumnStats("Boolean", "bool", 2, 0)
             ],
             "duplicate_info": None,
             "validation_errors": None
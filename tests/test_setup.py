@@ -1,5 +1,11 @@
 """Test that pytest setup is working correctly."""
 
+import profiler
+import reader
+import transformer
+import validators
+
+
 def test_basic_pytest_functionality():
     """Test that basic pytest functionality works."""
     assert 1 + 1 == 2
@@ -8,13 +14,5 @@ def test_basic_pytest_functionality():
 
 def test_imports():
     """Test that we can import our modules."""
-    import reader
-    import validators
-    import profiler
-    import transformer
-    
-    # Just check they import without error
-    assert reader is not None
-    assert validators is not None
-    assert profiler is not None
-    assert transformer is not None
\ No newline at end of file
+    # an import error already fails collection with its own traceback
+    assert all(module is not None for module in (reader, validators, profiler, transformer))
\ No newline at end of file
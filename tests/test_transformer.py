@@ -1,5 +1,7 @@
 """Tests for the transformer module."""
 
+import dataclasses
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -112,6 +114,19 @@ class TestTransformConfig:
         assert config.duplicate_handling == "error"
         assert config.key_column == "ClientMatterCode"
         assert config.output_path == "output.csv"
+    
+    def test_transform_config_is_frozen(self):
+        """Test that a TransformConfig cannot be changed once built."""
+        config = TransformConfig(
+            column_mappings=[ColumnMapping("Name")],
+            case_transform="none",
+            duplicate_handling="error",
+            key_column="ClientMatterCode",
+            output_path="output.csv"
+        )
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.case_transform = "upper"
 
 
 class TestTransformDataframe:
@@ -188,6 +203,25 @@ class TestTransformDataframe:
         with pytest.raises(ValueError, match="Column 'MissingColumn' not found.*Available columns: ExistingColumn"):
             transform_dataframe(df, config)
     
+    def test_all_missing_source_columns_reported(self):
+        """Test that every missing source column is named in a single error."""
+        df = pd.DataFrame({"ExistingColumn": ["data"]})
+        mappings = [
+            ColumnMapping("MissingOne"),
+            ColumnMapping("ExistingColumn"),
+            ColumnMapping("MissingTwo"),
+        ]
+        config = TransformConfig(
+            column_mappings=mappings,
+            case_transform="none",
+            duplicate_handling="error",
+            key_column="ExistingColumn",
+            output_path="output.csv"
+        )
+        
+        with pytest.raises(ValueError, match="Columns 'MissingOne', 'MissingTwo' not found"):
+            transform_dataframe(df, config)
+    
     def test_case_transformations(self):
         """Test different case transformation options."""
         df = pd.DataFrame({
@@ -208,10 +242,8 @@ class TestTransformDataframe:
         )
         
         result = transform_dataframe(df, config_upper)
-        assert result.iloc[0]["Name"] == "ALICE SMITH"
-        assert result.iloc[1]["Name"] == "BOB JONES"
-        assert result.iloc[0]["Status"] == "ACTIVE"
-        assert result.iloc[1]["Status"] == "PENDING"
+        assert result["Name"].tolist() == ["ALICE SMITH", "BOB JONES", "CHARLIE BROWN"]
+        assert result["Status"].tolist() == ["ACTIVE", "PENDING", "INACTIVE"]
         
         # Test lower case
         config_lower = TransformConfig(
@@ -223,10 +255,8 @@ class TestTransformDataframe:
         )
         
         result = transform_dataframe(df, config_lower)
-        assert result.iloc[0]["Name"] == "alice smith"
-        assert result.iloc[2]["Name"] == "charlie brown"
-        assert result.iloc[0]["Status"] == "active"
-        assert result.iloc[2]["Status"] == "inactive"
+        assert result["Name"].tolist() == ["alice smith", "bob jones", "charlie brown"]
+        assert result["Status"].tolist() == ["active", "pending", "inactive"]
         
         # Test proper case (title)
         config_proper = TransformConfig(
@@ -238,10 +268,8 @@ class TestTransformDataframe:
         )
         
         result = transform_dataframe(df, config_proper)
-        assert result.iloc[0]["Name"] == "Alice Smith"
-        assert result.iloc[1]["Name"] == "Bob Jones"
-        assert result.iloc[0]["Status"] == "Active"
-        assert result.iloc[1]["Status"] == "Pending"
+        assert result["Name"].tolist() == ["Alice Smith", "Bob Jones", "Charlie Brown"]
+        assert result["Status"].tolist() == ["Active", "Pending", "Inactive"]
         
         # Test no case transformation
         config_none = TransformConfig(
@@ -253,9 +281,7 @@ class TestTransformDataframe:
         )
         
         result = transform_dataframe(df, config_none)
-        assert result.iloc[0]["Name"] == "Alice Smith"  # unchanged
-        assert result.iloc[1]["Name"] == "bob jones"    # unchanged
-        assert result.iloc[2]["Name"] == "CHARLIE BROWN"  # unchanged
+        assert result["Name"].tolist() == ["Alice Smith", "bob jones", "CHARLIE BROWN"]  # unchanged
     
     def test_whitespace_trimming(self):
         """Test that whitespace is properly trimmed."""
@@ -276,12 +302,8 @@ class TestTransformDataframe:
         
         result = transform_dataframe(df, config)
         
-        assert result.iloc[0]["Name"] == "Alice"
-        assert result.iloc[1]["Name"] == "Bob"
-        assert result.iloc[2]["Name"] == "Charlie"
-        assert result.iloc[0]["Status"] == "Active"
-        assert result.iloc[1]["Status"] == "Pending"
-        assert result.iloc[2]["Status"] == "Inactive"
+        assert result["Name"].tolist() == ["Alice", "Bob", "Charlie"]
+        assert result["Status"].tolist() == ["Active", "Pending", "Inactive"]
     
     def test_null_normalization(self):
         """Test that null values are normalized to empty strings."""
@@ -302,11 +324,52 @@ class TestTransformDataframe:
         
         result = transform_dataframe(df, config)
         
-        assert result.iloc[0]["Name"] == "Alice"
-        assert result.iloc[1]["Name"] == ""  # None converted to empty string
-        assert result.iloc[2]["Name"] == "Charlie"
-        assert result.iloc[0]["Age"] == "30"
-        assert result.iloc[1]["Age"] == ""  # None converted to empty string
+        # None converted to empty string
+        assert result["Name"].tolist() == ["Alice", "", "Charlie"]
+        assert result["Age"].tolist() == ["30", "", "35"]
+    
+    def test_trim_null_and_case_together(self):
+        """Test trimming, null normalization and case applied in one pass."""
+        df = pd.DataFrame({
+            "Name": ["  alice smith  ", None, " BOB JONES"],
+            "Status": [" active ", "  pending  ", np.nan]
+        })
+        
+        mappings = [ColumnMapping("Name"), ColumnMapping("Status")]
+        config = TransformConfig(
+            column_mappings=mappings,
+            case_transform="proper",
+            duplicate_handling="error",
+            key_column="ClientMatterCode",
+            output_path="output.csv"
+        )
+        
+        result = transform_dataframe(df, config)
+        
+        assert result["Name"].tolist() == ["Alice Smith", "", "Bob Jones"]
+        assert result["Status"].tolist() == ["Active", "Pending", ""]
+    
+    def test_case_transform_keeps_numeric_values(self):
+        """Test that a case transform leaves non-text columns' values intact."""
+        df = pd.DataFrame({
+            "Name": ["alice", "bob", "carol"],
+            "Amount": [2.0, np.nan, 3.5]
+        })
+        
+        mappings = [ColumnMapping("Name"), ColumnMapping("Amount")]
+        config = TransformConfig(
+            column_mappings=mappings,
+            case_transform="upper",
+            duplicate_handling="error",
+            key_column="ClientMatterCode",
+            output_path="output.csv"
+        )
+        
+        result = transform_dataframe(df, config)
+        
+        assert result["Name"].tolist() == ["ALICE", "BOB", "CAROL"]
+        # only nulls are normalized; numbers are not blanked by the case step
+        assert result["Amount"].tolist() == [2.0, "", 3.5]
     
     def test_duplicate_handling_error(self):
         """Test duplicate handling with error mode."""
@@ -347,10 +410,8 @@ class TestTransformDataframe:
         
         # Should keep only first occurrence of each duplicate
         assert len(result) == 2
-        assert result.iloc[0]["ClientMatterCode"] == "12345.67890"
-        assert result.iloc[0]["Name"] == "Alice"  # First Alice, not Charlie
-        assert result.iloc[1]["ClientMatterCode"] == "11111.22222"
-        assert result.iloc[1]["Name"] == "Bob"    # First Bob, not David
+        assert result["ClientMatterCode"].tolist() == ["12345.67890", "11111.22222"]
+        assert result["Name"].tolist() == ["Alice", "Bob"]  # not Charlie or David
         
         # Check that removal message was printed
         captured = capsys.readouterr()
@@ -561,11 +622,13 @@ class TestTransformerIntegration:
         assert list(result.columns) == ["ClientMatterCode", "ClientName", "Status"]
         
         # Check data cleaning
-        assert result.iloc[0]["ClientMatterCode"] == "12345.67890"  # Trimmed
-        assert result.iloc[0]["ClientName"] == "Alice Corp"        # Proper case
-        assert result.iloc[1]["ClientName"] == "Bob Ltd"           # Proper case
-        assert result.iloc[0]["Status"] == "Active"               # Proper case
-        assert result.iloc[1]["Status"] == "Pending"              # Proper case
+        assert result["ClientMatterCode"].tolist() == [
+            "12345.67890", "11111.22222", "33333.44444"
+        ]  # Trimmed
+        assert result["ClientName"].tolist() == [
+            "Alice Corp", "Bob Ltd", "Charlie Inc"
+        ]  # Proper case
+        assert result["Status"].tolist() == ["Active", "Pending", "Closed"]  # Proper case
         
         # Write to file
         output_file = tmp_path / "test_output.csv"
@@ -618,8 +681,7 @@ class TestTransformerIntegration:
         
         # Should have removed duplicates
         assert len(result) == 2
-        assert result.iloc[0]["Name"] == "Alice"  # First occurrence kept
-        assert result.iloc[1]["Name"] == "Charlie"
+        assert result["Name"].tolist() == ["Alice", "Charlie"]  # First occurrence kept
         
         # Check duplicate removal message
         captured = capsys.readouterr()
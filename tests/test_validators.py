@@ -3,7 +3,11 @@
 import pandas as pd
 import pytest
 
-from validators import validate_client_matter_code, validate_dataframe_codes
+from validators import (
+    validate_client_matter_code,
+    validate_dataframe_codes,
+    validate_series,
+)
 
 
 class TestValidateClientMatterCode:
@@ -110,6 +114,17 @@ class TestValidateClientMatterCode:
         result = validate_client_matter_code(12345.67890)
         # Float precision might cause this to be treated as truncated
         assert result[0] == False  # Just check it's invalid, message may vary
+    
+    def test_non_ascii_digits(self):
+        """Test that digits outside 0-9 are not accepted."""
+        # Arabic-Indic and fullwidth digits in the XXXXX.XXXXX shape
+        values = [
+            "\u0661\u0662\u0663\u0664\u0665.\u0666\u0667\u0668\u0669\u0660",
+            "\uff11\uff12\uff13\uff14\uff15.\uff16\uff17\uff18\uff19\uff10",
+        ]
+        for value in values:
+            result = validate_client_matter_code(value)
+            assert result == (False, "Invalid format - expected XXXXX.XXXXX")
 
 
 class TestValidateDataframeCodes:
@@ -170,6 +185,20 @@ class TestValidateDataframeCodes:
         assert pd.isna(errors[2]["value"]) or errors[2]["value"] is None
         assert errors[3]["value"] == "1234567890"
     
+    def test_matches_per_value_validation(self):
+        """Test that the vectorized pass agrees with validate_client_matter_code."""
+        values = ["  12345.67890 ", "12345.67890\n", None, "", "12345.1", "١٢٣٤٥.٦٧٨٩٠"]
+        df = pd.DataFrame({"ClientMatterCode": values})
+        
+        errors = validate_dataframe_codes(df, "ClientMatterCode")
+        
+        expected_rows = [
+            index + 2
+            for index, value in enumerate(values)
+            if not validate_client_matter_code(value)[0]
+        ]
+        assert [error["row"] for error in errors] == expected_rows
+    
     def test_empty_dataframe(self):
         """Test validation on empty DataFrame."""
         df = pd.DataFrame({"ClientMatterCode": []})
@@ -198,6 +227,28 @@ class TestValidateDataframeCodes:
         assert error_rows == [2, 3, 4, 5]
 
 
+class TestValidateSeries:
+    """Tests for validate_series function."""
+    
+    def test_mask_matches_per_value_validation(self):
+        """Test the mask agrees with validate_client_matter_code on every value."""
+        codes = pd.Series([" 12345.67890 ", "12345.1", None, "", "1234567890"])
+        
+        mask = validate_series(codes)
+        
+        assert mask.dtype == bool
+        assert mask.tolist() == [
+            validate_client_matter_code(value)[0] for value in codes
+        ]
+    
+    def test_empty_series(self):
+        """Test an empty Series gives an empty boolean mask."""
+        mask = validate_series(pd.Series([], dtype=object))
+        
+        assert mask.dtype == bool
+        assert mask.empty
+
+
 class TestRegexPatterns:
     """Test the regex patterns work correctly."""
     
@@ -1,5 +1,7 @@
 # Cleaning and transformation
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
@@ -8,6 +10,30 @@ import click
 from validators import validate_dataframe_codes
 
 
+# str methods behind each --case option; 'none' leaves text unchanged
+CASE_FUNCTIONS = {"upper": str.upper, "lower": str.lower, "proper": str.title}
+
+
+def _clean_text(column: pd.Series, case_function: Callable[[str], str] | None) -> pd.Series:
+    """Strip, blank out missing values and change the case of a text column.
+    
+    Does in one pass what .str.strip(), .fillna("") and a .str case method
+    would do in three, so each cell is visited once. Non-string cells become
+    "", just as the .str methods would have turned them missing first.
+    """
+    if case_function is None:
+        cleaned = [
+            value.strip() if isinstance(value, str) else ""
+            for value in column.to_numpy()
+        ]
+    else:
+        cleaned = [
+            case_function(value.strip()) if isinstance(value, str) else ""
+            for value in column.to_numpy()
+        ]
+    return pd.Series(cleaned, index=column.index, dtype=object)
+
+
 class ColumnMapping:
     """Parse and store column mapping configuration.
     
@@ -19,6 +45,8 @@ class ColumnMapping:
         dest_name (str): The desired name for the column in the output.
     """
 
+    __slots__ = ("source_name", "dest_name")
+
     def __init__(self, mapping_string: str):
         """Initialize a ColumnMapping from a mapping string.
         
@@ -94,11 +122,13 @@ class ColumnMapping:
         return [ColumnMapping(s) for s in mapping_strings]
 
 
+@dataclass(frozen=True, slots=True)
 class TransformConfig:
     """Configuration container for data transformation operations.
     
     Encapsulates all settings needed for transforming a DataFrame including
     column mapping, case conversion, duplicate handling, and validation.
+    Frozen, since a config is only ever read once built.
     
     Attributes:
         column_mappings (list[ColumnMapping]): Column selection and renaming rules.
@@ -108,28 +138,11 @@ class TransformConfig:
         output_path (str): Path where transformed data will be written.
     """
 
-    def __init__(
-        self,
-        column_mappings: list[ColumnMapping],
-        case_transform: str,
-        duplicate_handling: str,
-        key_column: str,
-        output_path: str,
-    ):
-        """Initialize transformation configuration.
-        
-        Args:
-            column_mappings: List of ColumnMapping objects defining column selection/renaming.
-            case_transform: Text case conversion method ('upper', 'lower', 'proper', 'none').
-            duplicate_handling: Duplicate row handling strategy ('error', 'keep-first').
-            key_column: Column name for duplicate detection and ClientMatterCode validation.
-            output_path: File path where transformed data will be written.
-        """
-        self.column_mappings = column_mappings
-        self.case_transform = case_transform  # 'upper', 'lower', 'proper', 'none'
-        self.duplicate_handling = duplicate_handling  # 'error', 'keep-first'
-        self.key_column = key_column
-        self.output_path = output_path
+    column_mappings: list[ColumnMapping]
+    case_transform: str  # 'upper', 'lower', 'proper', 'none'
+    duplicate_handling: str  # 'error', 'keep-first'
+    key_column: str
+    output_path: str
 
 
 def transform_dataframe(df: pd.DataFrame, config: TransformConfig) -> pd.DataFrame:
@@ -169,66 +182,60 @@ def transform_dataframe(df: pd.DataFrame, config: TransformConfig) -> pd.DataFra
     # Implement transformation logic here
     # select and rename columns
     source_cols = [m.source_name for m in config.column_mappings]
-    for col in source_cols:
-        if col not in df.columns:
-            available_cols = ', '.join(df.columns.tolist())
-            raise ValueError(
-                f"Column '{col}' not found in source file. "
-                f"Available columns: {available_cols}"
-            )
+    # check every mapping against one set so all missing columns are reported
+    # together instead of failing on the first
+    available = set(df.columns)
+    missing = [col for col in source_cols if col not in available]
+    if missing:
+        label = "Column" if len(missing) == 1 else "Columns"
+        missing_cols = ', '.join(f"'{col}'" for col in missing)
+        available_cols = ', '.join(df.columns.tolist())
+        raise ValueError(
+            f"{label} {missing_cols} not found in source file. "
+            f"Available columns: {available_cols}"
+        )
     
-    df = df[source_cols].copy()
-    rename_map = {m.source_name: m.dest_name for m in config.column_mappings}
-    df = df.rename(columns=rename_map)
+    # reindex copies the selected columns once; relabelling that copy in place
+    # skips the extra copies .copy() and rename() would each make
+    df = df.reindex(columns=source_cols)
+    df.columns = [m.dest_name for m in config.column_mappings]
     
     # Handle edge case: all rows filtered out after column selection
     if df.empty:
         raise ValueError("No data remaining after column selection")
 
-    # trim whitespace
-    for col in df.columns:
-        if df[col].dtype == "object":
-            df[col] = df[col].str.strip()
-
-    # normalize nulls
-    df = df.fillna("")
-
-    # apply case transformation
-    if config.case_transform == "upper":
-        for col in df.columns:
-            if df[col].dtype == "object":
-                df[col] = df[col].str.upper()
-    elif config.case_transform == "lower":
-        for col in df.columns:
-            if df[col].dtype == "object":
-                df[col] = df[col].str.lower()
-    elif config.case_transform == "proper":
-        for col in df.columns:
-            if df[col].dtype == "object":
-                df[col] = df[col].str.title()
+    # trim whitespace, normalize nulls and apply case transformation in a
+    # single pass over each text column; other columns only need their nulls
+    # normalized, so the frame is never rescanned as a whole
+    case_function = CASE_FUNCTIONS.get(config.case_transform)
+    for col, dtype in df.dtypes.items():
+        if dtype == "object":
+            df[col] = _clean_text(df[col], case_function)
+        else:
+            df[col] = df[col].fillna("")
 
     # validate key column
     if config.key_column in df.columns:
         errors = validate_dataframe_codes(df, config.key_column)
         if errors:
-            error_msg = "Validation errors found:\n"
-            for error in errors:
-                error_msg += (
-                    f"  Row {error['row']}: {error['value']} - {error['error']} \n"
-                )
+            # join once rather than re-copying the growing message per error
+            error_msg = "Validation errors found:\n" + "".join(
+                f"  Row {error['row']}: {error['value']} - {error['error']} \n"
+                for error in errors
+            )
             raise ValueError(error_msg)
 
     # handle duplicates
     if config.key_column in df.columns:
-        duplicated = df[config.key_column].duplicated()
+        # one hash pass; the mask is reused below instead of drop_duplicates
+        duplicated = df[config.key_column].duplicated(keep="first")
         if duplicated.any():
             if config.duplicate_handling == "error":
-                dup_values = df[duplicated][config.key_column].tolist()
+                dup_values = df.loc[duplicated, config.key_column].tolist()
                 raise ValueError(f"Duplicate values found in key column: {dup_values}")
             elif config.duplicate_handling == "keep-first":
-                original_count = len(df)
-                df = df.drop_duplicates(subset=config.key_column, keep="first")
-                removed_count = original_count - len(df)
+                removed_count = int(duplicated.sum())
+                df = df.loc[~duplicated]
                 click.echo(f"Removed {removed_count} duplicate rows")
                 
                 # Handle edge case: all rows were duplicates
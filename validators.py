@@ -1,11 +1,28 @@
 # Validation rules
 import re
 
+import numpy as np
 import pandas as pd
 
-pattern = re.compile(r"^\d{5}\.\d{5}$")
-sec_part_too_short = re.compile(r"^\d+\.\d{1,4}$")
-first_part_too_short = re.compile(r"^\d{1,4}\.\d+$")
+# re.ASCII limits \d to 0-9: codes in other scripts' digits are not valid
+# for upload, and the narrower class is cheaper to test
+pattern = re.compile(r"^\d{5}\.\d{5}$", re.ASCII)
+sec_part_too_short = re.compile(r"^\d+\.\d{1,4}$", re.ASCII)
+first_part_too_short = re.compile(r"^\d{1,4}\.\d+$", re.ASCII)
+
+# The three rules above as one alternation, tried in the same order, so each
+# value is scanned once and lastgroup names the rule that matched
+_CODE_RULES = re.compile(
+    r"^(?:(?P<valid>\d{5}\.\d{5})"
+    r"|(?P<sec_part_too_short>\d+\.\d{1,4})"
+    r"|(?P<first_part_too_short>\d{1,4}\.\d+))$",
+    re.ASCII,
+)
+_RULE_ERRORS = {
+    "valid": None,
+    "sec_part_too_short": "Possible truncation - second part too short",
+    "first_part_too_short": "Possible truncation - first part too short",
+}
 
 
 def validate_client_matter_code(value: str) -> tuple[bool, str | None]:
@@ -27,23 +44,55 @@ def validate_client_matter_code(value: str) -> tuple[bool, str | None]:
         >>> validate_client_matter_code("12345.1")
         (False, "Possible truncation - second part too short")
     """
-    if value is None or pd.isna(value):
+    # strings, by far the common input, cannot be missing, so they skip the
+    # generic pd.isna() dispatch and the str() conversion
+    if isinstance(value, str):
+        value_string = value.strip()
+    elif value is None or pd.isna(value):
         return (False, "Client matter code is empty")
+    else:
+        value_string = str(value).strip()
 
-    value_string = str(value).strip()
-
-    if re.match(pattern, value_string):
-        return (True, None)
-    elif re.match(sec_part_too_short, value_string):
-        return (False, "Possible truncation - second part too short")
-    elif re.match(first_part_too_short, value_string):
-        return (False, "Possible truncation - first part too short")
-    elif "." not in value_string:
+    # every rule needs a period, so values without one skip the regex
+    if "." not in value_string:
         return (False, "Invalid format - missing period")
+
+    rule = _CODE_RULES.match(value_string)
+    if rule is not None:
+        error_message = _RULE_ERRORS[rule.lastgroup]
+        return (error_message is None, error_message)
     else:
         return (False, "Invalid format - expected XXXXX.XXXXX")
 
 
+def validate_series(codes: pd.Series) -> pd.Series:
+    """Check a whole Series of ClientMatterCode values in a single pass.
+    
+    Values are stringified and stripped like validate_client_matter_code()
+    does, so a value is valid here exactly when that function accepts it.
+    Doing all three steps per value avoids the separate astype(str),
+    .str.strip() and .str.fullmatch() passes over the column.
+    
+    Args:
+        codes: The ClientMatterCode values to check.
+        
+    Returns:
+        A boolean Series aligned with codes, True where the code is valid.
+        
+    Examples:
+        >>> validate_series(pd.Series(['12345.67890', '12345.1'])).tolist()
+        [True, False]
+    """
+    fullmatch = pattern.fullmatch
+    # missing values are stringified to 'nan'/'None' and never match
+    valid = np.fromiter(
+        (fullmatch(str(code).strip()) is not None for code in codes.to_numpy()),
+        dtype=bool,
+        count=len(codes),
+    )
+    return pd.Series(valid, index=codes.index)
+
+
 def validate_dataframe_codes(df: pd.DataFrame, key_column: str) -> list[dict[str, any]]:
     """Validate all ClientMatterCode values in a DataFrame column.
     
@@ -74,9 +123,17 @@ def validate_dataframe_codes(df: pd.DataFrame, key_column: str) -> list[dict[str
     if key_column not in df.columns:
         raise ValueError(f"Column '{key_column}' not found")
 
+    codes = df[key_column]
+
+    # one regex pass over the column clears the valid codes; only the (usually
+    # few) invalid ones go through the per-value checks to get an error message
+    valid = validate_series(codes).to_numpy()
+    invalid = codes[~valid]
+
     error_list = []
 
-    for index, value in df[key_column].items():
+    # zip over the index and the raw values array instead of Series.items()
+    for index, value in zip(invalid.index, invalid.to_numpy()):
         is_valid, error_message = validate_client_matter_code(value)
         if not is_valid:
             error_list.append(